@@ -1,19 +1,118 @@
 """Graph data export API"""
 
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from hashlib import blake2b
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import asyncio
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from loguru import logger
+from neo4j.exceptions import ClientError
 from app.db.neo4j import Neo4jConnection
+from app.services.query_cache import relationship_cache, response_cache
 
 router = APIRouter()
 
-
-def get_neo4j(request: Request) -> Neo4jConnection:
+# Relationship queries return (source, target, type, props) rows; see
+# format_edges, which unpacks them by position
+
+# Relationships whose both endpoints are in a given node set
+RELATIONSHIPS_BETWEEN_QUERY = """
+MATCH (n)-[r]->(m)
+WHERE n.uuid IN $uuids AND m.uuid IN $uuids
+RETURN n.uuid as source, m.uuid as target, type(r) as type, properties(r) as props
+"""
+
+# Every relationship in the graph
+ALL_RELATIONSHIPS_QUERY = """
+MATCH (n)-[r]->(m)
+RETURN n.uuid as source, m.uuid as target, type(r) as type, properties(r) as props
+"""
+
+# All nodes (or the first $limit), collected server-side into a single record
+ALL_NODES_QUERY = """
+MATCH (n)
+RETURN collect(n) as nodes, collect(n.uuid) as uuids
+"""
+LIMITED_NODES_QUERY = """
+MATCH (n) WITH n LIMIT $limit
+RETURN collect(n) as nodes, collect(n.uuid) as uuids
+"""
+
+# Nodes within depth of a center node. Variable-length bounds cannot be
+# parameterized, so there is one query per allowed depth (1-3). The LIMIT
+# sits inside the subquery so expansion stops once max_nodes distinct nodes
+# are found, instead of collecting the whole neighbourhood and slicing it.
+SUBGRAPH_QUERIES = {
+    depth: f"""
+MATCH (center {{uuid: $uuid}})
+CALL {{
+    WITH center
+    OPTIONAL MATCH (center)-[*0..{depth}]-(connected)
+    WITH DISTINCT connected
+    LIMIT $max_nodes
+    RETURN collect(connected) as connected
+}}
+RETURN center, connected
+"""
+    for depth in (1, 2, 3)
+}
+
+# Graph statistics from pre-maintained counters (requires APOC)
+COUNTS_STORE_STATS_QUERY = """
+CALL apoc.meta.stats()
+YIELD nodeCount, relCount, labels, relTypesCount
+RETURN nodeCount, relCount, labels, relTypesCount
+"""
+
+# Error code Neo4j reports when APOC is not installed
+PROCEDURE_NOT_FOUND = "Neo.ClientError.Procedure.ProcedureNotFound"
+
+# Graph statistics by scanning, used when APOC is not installed. A node is
+# counted once per label, as apoc.meta.stats() does.
+NODE_STATS_QUERY = """
+MATCH (n)
+UNWIND labels(n) as label
+RETURN label, count(*) as count
+ORDER BY count DESC
+"""
+REL_STATS_QUERY = """
+MATCH ()-[r]->()
+RETURN type(r) as type, count(r) as count
+ORDER BY count DESC
+"""
+# Each unfiltered count is answered from the counts store
+TOTALS_QUERY = """
+CALL { MATCH (n) RETURN count(n) as node_count }
+CALL { MATCH ()-[r]->() RETURN count(r) as relationship_count }
+RETURN node_count, relationship_count
+"""
+
+# Larger node sets are always fetched fresh to bound cache memory
+MAX_CACHED_NODE_SET = 200
+
+# Records per chunk when streaming a full graph export
+EXPORT_BATCH_SIZE = 1000
+
+
+async def get_neo4j(request: Request) -> Neo4jConnection:
     """Get Neo4j connection from app state"""
     return request.app.state.neo4j
 
 
 @router.get("/full")
-def get_full_graph(
+async def get_full_graph(
+    request: Request,
     neo4j: Neo4jConnection = Depends(get_neo4j),
     limit: Optional[int] = Query(
         None, description="Limit number of nodes (default: all)"
@@ -26,110 +125,110 @@ def get_full_graph(
     like D3.js, vis.js, or Cytoscape.js
     """
     try:
-        # Get all nodes
-        if limit:
-            nodes_query = f"MATCH (n) RETURN n LIMIT {limit}"
-        else:
-            nodes_query = "MATCH (n) RETURN n"
+        return await cached_response(
+            request, f"full:{limit}", lambda: _full_graph(neo4j, limit)
+        )
 
-        nodes_result = neo4j.execute_query(nodes_query)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to export graph: {str(e)}")
 
-        # Get all relationships
-        if limit and nodes_result:
-            # Get relationships for limited nodes
-            node_ids = []
-            for record in nodes_result:
-                if isinstance(record, dict) and "n" in record:
-                    node = record["n"]
-                    if isinstance(node, dict) and "uuid" in node:
-                        node_ids.append(node["uuid"])
-
-            if node_ids:
-                rels_query = """
-                MATCH (n)-[r]->(m)
-                WHERE n.uuid IN $node_ids OR m.uuid IN $node_ids
-                RETURN n.uuid as source, m.uuid as target, type(r) as type, properties(r) as props
-                """
-                rels_result = neo4j.execute_query(rels_query, {"node_ids": node_ids})
-            else:
-                rels_result = []
+
+async def _full_graph(neo4j: Neo4jConnection, limit: Optional[int]) -> Dict:
+    """Nodes and edges of the whole graph, or of its first limit nodes"""
+    # Get all nodes, collected server-side into a single record
+    nodes_query = LIMITED_NODES_QUERY if limit else ALL_NODES_QUERY
+
+    records = await neo4j.execute_query_async(nodes_query, {"limit": limit})
+    nodes_result = records[0]["nodes"]
+
+    # Get all relationships
+    if limit and nodes_result:
+        # Get relationships for limited nodes
+        node_ids = records[0]["uuids"]
+
+        # Only edges whose both endpoints were returned; edges to nodes
+        # outside the limit cannot be drawn and just inflate the payload
+        if node_ids:
+            rels_result = await neo4j.execute_query_rows_async(
+                RELATIONSHIPS_BETWEEN_QUERY, {"uuids": node_ids}
+            )
         else:
-            # Get all relationships
-            rels_query = """
-            MATCH (n)-[r]->(m)
-            RETURN n.uuid as source, m.uuid as target, type(r) as type, properties(r) as props
-            """
-            rels_result = neo4j.execute_query(rels_query)
-
-        # Process nodes
-        nodes_data = []
-        processed_uuids = set()
-
-        for record in nodes_result:
-            if not isinstance(record, dict):
-                continue
-
-            node = record.get("n")
-            if not isinstance(node, dict):
-                continue
-
-            node_uuid = node.get("uuid")
-            if not node_uuid or node_uuid in processed_uuids:
-                continue
-
-            processed_uuids.add(node_uuid)
-
-            # Determine node type/label
-            label = _determine_node_label(node)
-
-            node_data = {
-                "id": node_uuid,
-                "label": label,
-                "properties": {k: v for k, v in node.items() if k != "uuid"},
-                "display_name": node.get("name") or node.get("title") or node_uuid[:8],
-            }
-            nodes_data.append(node_data)
-
-        # Process relationships
-        edges_data = []
-        for record in rels_result:
-            if not isinstance(record, dict):
-                continue
-
-            source = record.get("source")
-            target = record.get("target")
-            rel_type = record.get("type")
-
-            if source and target and rel_type:
-                props = record.get("props", {})
-                if not isinstance(props, dict):
-                    props = {}
-
-                edge_data = {
-                    "id": f"{source}-{rel_type}-{target}",
-                    "source": source,
-                    "target": target,
-                    "type": rel_type,
-                    "properties": props,
-                }
-                edges_data.append(edge_data)
-
-        return {
-            "nodes": nodes_data,
-            "edges": edges_data,
-            "metadata": {
-                "node_count": len(nodes_data),
-                "edge_count": len(edges_data),
-                "limit_applied": limit is not None,
-            },
-        }
+            rels_result = []
+    else:
+        # Get all relationships
+        rels_result = await neo4j.execute_query_rows_async(ALL_RELATIONSHIPS_QUERY)
+
+    # Process nodes
+    nodes_data = []
+    processed_uuids = set()
+
+    for node in nodes_result:
+        if not isinstance(node, dict):
+            continue
+
+        node_uuid = node.get("uuid")
+        if not node_uuid or node_uuid in processed_uuids:
+            continue
+
+        processed_uuids.add(node_uuid)
+        nodes_data.append(_format_node(node))
+
+    # Process relationships
+    edges_data = format_edges(rels_result)
+
+    return {
+        "nodes": nodes_data,
+        "edges": edges_data,
+        "metadata": {
+            "node_count": len(nodes_data),
+            "edge_count": len(edges_data),
+            "limit_applied": limit is not None,
+        },
+    }
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to export graph: {str(e)}")
+
+@router.get("/export")
+async def export_graph(neo4j: Neo4jConnection = Depends(get_neo4j)):
+    """
+    Stream the entire graph as JSON ({nodes, edges}) for large exports
+
+    Unlike /full, records are encoded and sent in batches as they arrive from
+    Neo4j, so memory use stays flat regardless of graph size.
+    """
+    return StreamingResponse(_stream_graph(neo4j), media_type="application/json")
+
+
+async def _stream_graph(neo4j: Neo4jConnection) -> AsyncIterator[bytes]:
+    """Encode nodes and then edges batch by batch into one JSON document"""
+    yield b'{"nodes":['
+    separator = b""
+    async for batch in neo4j.stream_query_async(
+        "MATCH (n) RETURN n", batch_size=EXPORT_BATCH_SIZE
+    ):
+        nodes = [
+            _format_node(record["n"]) for record in batch if record["n"].get("uuid")
+        ]
+        if nodes:
+            # Strip the list brackets so batches join into a single array
+            yield separator + orjson.dumps(jsonable_encoder(nodes))[1:-1]
+            separator = b","
+
+    yield b'],"edges":['
+    separator = b""
+    async for batch in neo4j.stream_query_async(
+        ALL_RELATIONSHIPS_QUERY, batch_size=EXPORT_BATCH_SIZE, rows=True
+    ):
+        edges = format_edges(batch)
+        if edges:
+            yield separator + orjson.dumps(jsonable_encoder(edges))[1:-1]
+            separator = b","
+
+    yield b"]}"
 
 
 @router.get("/subgraph/{node_uuid}")
-def get_node_subgraph(
+async def get_node_subgraph(
+    request: Request,
     node_uuid: str,
     neo4j: Neo4jConnection = Depends(get_neo4j),
     depth: int = Query(1, ge=1, le=3, description="Depth of relationships to traverse"),
@@ -144,92 +243,11 @@ def get_node_subgraph(
         max_nodes: Maximum nodes to return
     """
     try:
-        # Get connected nodes within depth
-        nodes_query = f"""
-        MATCH (center {{uuid: $uuid}})
-        OPTIONAL MATCH path = (center)-[*0..{depth}]-(connected)
-        WITH center, collect(DISTINCT connected) as connected_nodes
-        RETURN center, connected_nodes[0..{max_nodes}] as connected
-        """
-
-        result = neo4j.execute_query(nodes_query, {"uuid": node_uuid})
-
-        if not result or not result[0].get("center"):
-            raise HTTPException(status_code=404, detail=f"Node {node_uuid} not found")
-
-        # Extract center and connected nodes
-        center_node = result[0].get("center")
-        connected_nodes = result[0].get("connected", [])
-
-        all_nodes = [center_node] + [n for n in connected_nodes if n]
-        node_uuids = [
-            n["uuid"] for n in all_nodes if isinstance(n, dict) and n.get("uuid")
-        ]
-
-        # Get relationships between these nodes
-        if node_uuids:
-            rels_query = """
-            MATCH (n)-[r]->(m)
-            WHERE n.uuid IN $uuids AND m.uuid IN $uuids
-            RETURN n.uuid as source, m.uuid as target, type(r) as type, properties(r) as props
-            """
-            rels_result = neo4j.execute_query(rels_query, {"uuids": node_uuids})
-        else:
-            rels_result = []
-
-        # Process nodes
-        nodes_data = []
-        for node in all_nodes:
-            if not isinstance(node, dict) or not node.get("uuid"):
-                continue
-
-            label = _determine_node_label(node)
-
-            node_data = {
-                "id": node["uuid"],
-                "label": label,
-                "properties": {k: v for k, v in node.items() if k != "uuid"},
-                "display_name": node.get("name")
-                or node.get("title")
-                or node["uuid"][:8],
-                "is_center": node["uuid"] == node_uuid,
-            }
-            nodes_data.append(node_data)
-
-        # Process relationships
-        edges_data = []
-        for record in rels_result:
-            if not isinstance(record, dict):
-                continue
-
-            source = record.get("source")
-            target = record.get("target")
-            rel_type = record.get("type")
-
-            if source and target and rel_type:
-                props = record.get("props", {})
-                if not isinstance(props, dict):
-                    props = {}
-
-                edge_data = {
-                    "id": f"{source}-{rel_type}-{target}",
-                    "source": source,
-                    "target": target,
-                    "type": rel_type,
-                    "properties": props,
-                }
-                edges_data.append(edge_data)
-
-        return {
-            "nodes": nodes_data,
-            "edges": edges_data,
-            "metadata": {
-                "center_node": node_uuid,
-                "depth": depth,
-                "node_count": len(nodes_data),
-                "edge_count": len(edges_data),
-            },
-        }
+        return await cached_response(
+            request,
+            f"subgraph:{node_uuid}:{depth}:{max_nodes}",
+            lambda: _node_subgraph(neo4j, node_uuid, depth, max_nodes),
+        )
 
     except HTTPException:
         raise
@@ -237,60 +255,78 @@ def get_node_subgraph(
         raise HTTPException(status_code=500, detail=f"Failed to get subgraph: {str(e)}")
 
 
+async def _node_subgraph(
+    neo4j: Neo4jConnection, node_uuid: str, depth: int, max_nodes: int
+) -> Dict:
+    """Nodes within depth hops of node_uuid and the edges between them"""
+    # Get connected nodes within depth
+    result = await neo4j.execute_query_async(
+        SUBGRAPH_QUERIES[depth], {"uuid": node_uuid, "max_nodes": max_nodes}
+    )
+
+    if not result or not result[0].get("center"):
+        raise HTTPException(status_code=404, detail=f"Node {node_uuid} not found")
+
+    # Extract center and connected nodes
+    center_node = result[0].get("center")
+    connected_nodes = result[0].get("connected", [])
+
+    # Process nodes; the zero-length path also returns the center node, so
+    # de-duplicate by uuid
+    nodes_data = []
+    seen = set()
+    for node in [center_node] + connected_nodes:
+        if not isinstance(node, dict) or not node.get("uuid"):
+            continue
+        if node["uuid"] in seen:
+            continue
+        seen.add(node["uuid"])
+
+        label = _determine_node_label(node)
+
+        node_data = {
+            "id": node["uuid"],
+            "label": label,
+            "properties": _node_properties(node),
+            "display_name": node.get("name") or node.get("title") or node["uuid"][:8],
+            "is_center": node["uuid"] == node_uuid,
+        }
+        nodes_data.append(node_data)
+
+    # Get relationships between these nodes
+    if nodes_data:
+        rels_result = await get_relationships_between(
+            neo4j, [node["id"] for node in nodes_data]
+        )
+    else:
+        rels_result = []
+
+    # Process relationships
+    edges_data = format_edges(rels_result)
+
+    return {
+        "nodes": nodes_data,
+        "edges": edges_data,
+        "metadata": {
+            "center_node": node_uuid,
+            "depth": depth,
+            "node_count": len(nodes_data),
+            "edge_count": len(edges_data),
+        },
+    }
+
+
 @router.get("/statistics")
-def get_graph_statistics(neo4j: Neo4jConnection = Depends(get_neo4j)):
+async def get_graph_statistics(
+    request: Request, neo4j: Neo4jConnection = Depends(get_neo4j)
+):
     """
     Get statistics about the graph
     """
     try:
-        # Count nodes by label
-        node_stats_query = """
-        MATCH (n)
-        RETURN labels(n)[0] as label, count(n) as count
-        ORDER BY count DESC
-        """
-
-        # Count relationships by type
-        rel_stats_query = """
-        MATCH ()-[r]->()
-        RETURN type(r) as type, count(r) as count
-        ORDER BY count DESC
-        """
-
-        # Get total counts
-        total_query = """
-        MATCH (n)
-        WITH count(n) as node_count
-        OPTIONAL MATCH ()-[r]->()
-        RETURN node_count, count(r) as relationship_count
-        """
-
-        node_stats = neo4j.execute_query(node_stats_query)
-        rel_stats = neo4j.execute_query(rel_stats_query)
-        totals = neo4j.execute_query(total_query)
-
-        # Build response
-        nodes_by_type = {}
-        for stat in node_stats:
-            if isinstance(stat, dict) and "label" in stat and "count" in stat:
-                nodes_by_type[stat["label"]] = stat["count"]
-
-        relationships_by_type = {}
-        for stat in rel_stats:
-            if isinstance(stat, dict) and "type" in stat and "count" in stat:
-                relationships_by_type[stat["type"]] = stat["count"]
-
-        total_nodes = 0
-        total_relationships = 0
-        if totals and isinstance(totals[0], dict):
-            total_nodes = totals[0].get("node_count", 0)
-            total_relationships = totals[0].get("relationship_count", 0)
-
-        return {
-            "totals": {"nodes": total_nodes, "relationships": total_relationships},
-            "nodes_by_type": nodes_by_type,
-            "relationships_by_type": relationships_by_type,
-        }
+        return await cached_response(
+            request, "statistics", lambda: _graph_statistics(neo4j)
+        )
 
     except Exception as e:
         raise HTTPException(
@@ -298,6 +334,220 @@ def get_graph_statistics(neo4j: Neo4jConnection = Depends(get_neo4j)):
         )
 
 
+async def _graph_statistics(neo4j: Neo4jConnection) -> Dict:
+    """
+    Read Neo4j's counts store through APOC when it is installed, and fall back
+    to counting with plain Cypher otherwise
+    """
+    try:
+        return await _counts_store_statistics(neo4j)
+    except ClientError as e:
+        if e.code != PROCEDURE_NOT_FOUND:
+            raise
+        return await _scanned_statistics(neo4j)
+
+
+async def _counts_store_statistics(neo4j: Neo4jConnection) -> Dict:
+    """Graph statistics from pre-maintained counters (requires APOC)"""
+    result = await neo4j.execute_query_async(COUNTS_STORE_STATS_QUERY)
+    stats = result[0]
+
+    return {
+        "totals": {"nodes": stats["nodeCount"], "relationships": stats["relCount"]},
+        "nodes_by_type": _sorted_counts(stats["labels"]),
+        "relationships_by_type": _sorted_counts(stats["relTypesCount"]),
+    }
+
+
+async def _scanned_statistics(neo4j: Neo4jConnection) -> Dict:
+    """Graph statistics computed by scanning nodes and relationships"""
+    # The three aggregations are independent, so run them concurrently
+    node_stats, rel_stats, totals = await asyncio.gather(
+        neo4j.execute_query_async(NODE_STATS_QUERY),
+        neo4j.execute_query_async(REL_STATS_QUERY),
+        neo4j.execute_query_async(TOTALS_QUERY),
+    )
+
+    # Build response
+    nodes_by_type = {}
+    for stat in node_stats:
+        if isinstance(stat, dict) and "label" in stat and "count" in stat:
+            nodes_by_type[stat["label"]] = stat["count"]
+
+    relationships_by_type = {}
+    for stat in rel_stats:
+        if isinstance(stat, dict) and "type" in stat and "count" in stat:
+            relationships_by_type[stat["type"]] = stat["count"]
+
+    total_nodes = 0
+    total_relationships = 0
+    if totals and isinstance(totals[0], dict):
+        total_nodes = totals[0].get("node_count", 0)
+        total_relationships = totals[0].get("relationship_count", 0)
+
+    return {
+        "totals": {"nodes": total_nodes, "relationships": total_relationships},
+        "nodes_by_type": nodes_by_type,
+        "relationships_by_type": relationships_by_type,
+    }
+
+
+def _sorted_counts(counts: Dict[str, int]) -> Dict[str, int]:
+    """
+    Order a name -> count map by count, largest first
+
+    Zero counts (labels or types with no remaining members) are dropped, as
+    the scanning queries never report them.
+    """
+    return dict(
+        sorted(
+            ((name, count) for name, count in counts.items() if count),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+    )
+
+
+async def warm_query_plans(neo4j: Neo4jConnection):
+    """
+    EXPLAIN every fixed graph query once so Neo4j has cached their plans
+    before the first request arrives
+    """
+    queries = [
+        RELATIONSHIPS_BETWEEN_QUERY,
+        ALL_RELATIONSHIPS_QUERY,
+        ALL_NODES_QUERY,
+        LIMITED_NODES_QUERY,
+        NODE_STATS_QUERY,
+        REL_STATS_QUERY,
+        TOTALS_QUERY,
+        *SUBGRAPH_QUERIES.values(),
+    ]
+    for query in queries:
+        try:
+            await neo4j.execute_query_async(f"EXPLAIN {query}")
+        except Exception as e:
+            logger.warning(f"Plan warmup failed: {e}")
+            return
+
+
+async def get_relationships_between(
+    neo4j: Neo4jConnection, node_uuids: List[str]
+) -> List[Tuple]:
+    """
+    Get all relationships between the given nodes as (source, target, type,
+    props) rows
+
+    Results for small node sets are cached briefly, since the UI tends to
+    request the same neighbourhood repeatedly.
+    """
+    if len(node_uuids) > MAX_CACHED_NODE_SET:
+        return await neo4j.execute_query_rows_async(
+            RELATIONSHIPS_BETWEEN_QUERY, {"uuids": node_uuids}
+        )
+
+    cache_key = tuple(sorted(set(node_uuids)))
+    rels_result = relationship_cache.get(cache_key)
+    if rels_result is None:
+        rels_result = await neo4j.execute_query_rows_async(
+            RELATIONSHIPS_BETWEEN_QUERY, {"uuids": node_uuids}
+        )
+        relationship_cache.set(cache_key, rels_result)
+
+    return rels_result
+
+
+async def cached_response(
+    request: Request, key: str, build: Callable[[], Awaitable[Any]]
+) -> Response:
+    """
+    Serve a JSON response from response_cache, answering 304 Not Modified
+    when the client already holds the same body (If-None-Match)
+
+    The serialized body and its ETag are cached under key, so a matching
+    If-None-Match is answered from the cached ETag before any query runs,
+    and other hits skip the queries and serialization. On a miss, build()
+    produces the content.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        cached_etag = await response_cache.get(f"{key}:etag")
+        if cached_etag and _etag_matches(if_none_match, cached_etag.decode()):
+            return Response(status_code=304, headers={"ETag": cached_etag.decode()})
+
+    body = await response_cache.get(f"{key}:body")
+    if body is None:
+        body = orjson.dumps(jsonable_encoder(await build()))
+        etag = _etag(body)
+        await response_cache.set(f"{key}:body", body)
+        await response_cache.set(f"{key}:etag", etag.encode())
+    else:
+        etag = _etag(body)
+
+    headers = {"ETag": etag}
+
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a response body"""
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header names etag
+
+    The header may be "*" or a comma-separated list of tags. Tags are compared
+    weakly, as If-None-Match requires, so W/"x" matches "x".
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def format_edges(rels_result: List[Tuple]) -> List[Dict]:
+    """
+    Convert (source, target, type, props) relationship rows to graph edges,
+    skipping incomplete rows
+    """
+    return [
+        {
+            "id": f"{source}-{rel_type}-{target}",
+            "source": source,
+            "target": target,
+            "type": rel_type,
+            "properties": props or {},
+        }
+        for source, target, rel_type, props in rels_result
+        if source and target and rel_type
+    ]
+
+
+def _format_node(node: dict) -> Dict:
+    """Convert a node to the graph node format used by the export endpoints"""
+    return {
+        "id": node["uuid"],
+        "label": _determine_node_label(node),
+        "properties": _node_properties(node),
+        "display_name": node.get("name") or node.get("title") or node["uuid"][:8],
+    }
+
+
+def _node_properties(node: dict) -> dict:
+    """Copy node properties without the uuid (exposed separately as id)"""
+    properties = node.copy()
+    properties.pop("uuid", None)
+    return properties
+
+
 def _determine_node_label(node: dict) -> str:
     """Determine node label from its properties"""
     if "dob" in node:
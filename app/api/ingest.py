@@ -6,14 +6,20 @@ from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File
 from sqlalchemy.orm import Session
 import PyPDF2
 
+from loguru import logger
 from app.db.neo4j import Neo4jConnection
 from app.db.database import get_db
-from app.db.models import Document, Chunk
+from app.db.models import Document, bulk_insert_chunks
 from app.models.schemas import DocumentUpload
 from app.services.extraction import extraction_service
 from app.services.resolution import ResolutionService
 from app.services.chunking import chunking_service
 from app.services.embedding import embedding_service
+from app.services.query_cache import (
+    query_cache,
+    relationship_cache,
+    response_cache,
+)
 
 router = APIRouter()
 
@@ -74,7 +80,7 @@ def upload_pdf(file: UploadFile = File(...), services: Dict = Depends(get_servic
             try:
                 os.unlink(temp_file_path)
             except Exception as e:
-                print(f"Warning: Could not delete temporary file {temp_file_path}: {e}")
+                logger.warning(f"Could not delete temporary file {temp_file_path}: {e}")
 
 
 def _extract_text_from_pdf(pdf_path: str) -> str:
@@ -94,7 +100,7 @@ def _extract_text_from_pdf(pdf_path: str) -> str:
                     text += page_text + "\n\n"
 
     except Exception as e:
-        print(f"Error extracting text from PDF: {e}")
+        logger.error(f"Error extracting text from PDF: {e}")
         raise
 
     return text.strip()
@@ -116,36 +122,35 @@ def upload_document(document: DocumentUpload, services: Dict = Depends(get_servi
         db.add(doc_record)
         db.flush()  # Get the UUID without committing
 
-        # Step 2: Chunk the text
-        chunks = chunking.chunk_text(document.text)
+        # Step 2: Chunk the text; chunk indexes are positions in the list
+        chunk_texts = chunking.chunk_texts(document.text)
 
         # Step 3: Generate embeddings for chunks
-        chunk_texts = [chunk["text"] for chunk in chunks]
         embeddings = embedding.generate_embeddings(chunk_texts)
 
         # Step 4: Save chunks with embeddings to PostgreSQL
-        chunk_records = []
-        for i, chunk in enumerate(chunks):
-            chunk_record = Chunk(
-                document_id=doc_record.uuid,
-                chunk_index=chunk["chunk_index"],
-                text=chunk["text"],
-                embedding=embeddings[i] if embeddings[i] else None,
-            )
-            db.add(chunk_record)
-            chunk_records.append(chunk_record)
-
-        # Commit document and chunks to database
+        chunk_rows = [
+            {
+                "document_id": doc_record.uuid,
+                "chunk_index": i,
+                "text": chunk_text,
+                "embedding": embeddings[i] if embeddings[i] else None,
+            }
+            for i, chunk_text in enumerate(chunk_texts)
+        ]
+        bulk_insert_chunks(db, chunk_rows)
+
+        # Commit document and chunks to database in one transaction
         db.commit()
 
         # Step 5: Extract entities from each chunk with context
         chunk_extractions = []
         previous_context = {}
 
-        for i, chunk_record in enumerate(chunk_records):
+        for chunk_text in chunk_texts:
             # Extract entities with previous context
             extracted = extraction.extract_entities(
-                chunk_record.text, context=previous_context
+                chunk_text, context=previous_context
             )
             chunk_extractions.append(extracted)
 
@@ -187,13 +192,13 @@ def upload_document(document: DocumentUpload, services: Dict = Depends(get_servi
             if subject_ref in reference_map:
                 resolved_assertion["subject_ref"] = reference_map[subject_ref]
             else:
-                print(f"Warning: Could not resolve subject_ref: {subject_ref}")
+                logger.warning(f"Could not resolve subject_ref: {subject_ref}")
                 continue
 
             if object_ref in reference_map:
                 resolved_assertion["object_ref"] = reference_map[object_ref]
             else:
-                print(f"Warning: Could not resolve object_ref: {object_ref}")
+                logger.warning(f"Could not resolve object_ref: {object_ref}")
                 continue
 
             resolved_assertions.append(resolved_assertion)
@@ -208,9 +213,15 @@ def upload_document(document: DocumentUpload, services: Dict = Depends(get_servi
             neo4j, upsert_plan, document_id=str(doc_record.uuid)
         )
 
+        # New entities can change how search queries resolve to UUIDs and
+        # which relationships exist between cached node sets
+        query_cache.clear()
+        relationship_cache.clear()
+        response_cache.invalidate()
+
         return {
             "document_id": str(doc_record.uuid),
-            "chunks_created": len(chunk_records),
+            "chunks_created": len(chunk_rows),
             "entities_extracted": sum(
                 len(entities) for entities in normalized.values()
             ),
@@ -414,7 +425,7 @@ def _execute_upsert_plan(
 
         except Exception as e:
             error_msg = f"Relationship upsert failed - Type: {rel_type}, From: {from_uuid}, To: {to_uuid}, Error: {e}"
-            print(error_msg)
+            logger.error(error_msg)
             results["errors"].append(error_msg)
 
     return results
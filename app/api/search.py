@@ -1,32 +1,103 @@
 """Natural language search API"""
 
-from typing import Dict
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+import re
 import time
-from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Request,
+    Query,
+    Response,
+)
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 from app.models.search_schemas import (
     SearchRequest,
     SearchResponse,
     CypherResponse,
     GraphSearchResponse,
+    EntityMatch,
 )
-from app.services.entity_matcher import EntityMatcher
-from app.services.cypher_generator import CypherGenerator
+from app.api.graph import format_edges, get_relationships_between
+from app.services.cypher_generator import entity_parameters
+from app.services.query_cache import query_cache
 
 router = APIRouter()
 
+# Whether a generated query already limits its results
+_HAS_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+# Longest query accepted for validation; longer ones are rejected without
+# sending them to Neo4j
+MAX_CYPHER_LENGTH = 10_000
 
-def get_services(request: Request) -> Dict:
-    """Get required services for search"""
-    neo4j_conn = request.app.state.neo4j
+
+async def get_services(request: Request) -> Dict:
+    """Get required services for search (created once at app startup)"""
+    state = request.app.state
     return {
-        "neo4j": neo4j_conn,
-        "entity_matcher": EntityMatcher(neo4j_conn),
-        "cypher_generator": CypherGenerator(neo4j_conn),
+        "neo4j": state.neo4j,
+        "entity_matcher": state.entity_matcher,
+        "cypher_generator": state.cypher_generator,
     }
 
 
+def _model_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON bytes
+
+    Returning a Response skips FastAPI re-validating the model against the
+    route's response_model, which stays on the route for the OpenAPI schema.
+    Values pydantic cannot serialize, such as Neo4j temporal types, are
+    rendered with str().
+    """
+    return Response(model.model_dump_json(fallback=str), media_type="application/json")
+
+
+def _translate_query(
+    natural_query: str, services: Dict
+) -> Tuple[Dict[str, EntityMatch], str, str]:
+    """
+    Extract and match entities, then generate Cypher for a natural language query
+
+    Valid translations are cached by normalized query text, so repeated queries
+    skip both LLM calls and the full-text lookups.
+
+    Returns:
+        Tuple of (entity_mappings, cypher, validation_status)
+    """
+    entity_matcher = services["entity_matcher"]
+    cypher_generator = services["cypher_generator"]
+
+    # Normalize once; the cleaned text feeds both LLM prompts
+    natural_query, cache_key = cypher_generator.prepare(natural_query)
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Extract entities from natural language query
+    extracted_entities = cypher_generator.extract_entities_from_query(natural_query)
+
+    # Match extracted entities to database entities
+    entity_mappings = entity_matcher.find_best_matches(extracted_entities)
+
+    # Generate Cypher query
+    cypher, validation_status = cypher_generator.natural_to_cypher(
+        natural_query, entity_mappings
+    )
+
+    translation = (entity_mappings, cypher, validation_status)
+    if validation_status == "valid":
+        query_cache.set(cache_key, translation)
+
+    return translation
+
+
 @router.post("/to-cypher", response_model=CypherResponse)
-def natural_to_cypher(
+async def natural_to_cypher(
     search_request: SearchRequest, services: Dict = Depends(get_services)
 ):
     """
@@ -39,36 +110,31 @@ def natural_to_cypher(
     4. Validates the query syntax
     """
     try:
-        entity_matcher = services["entity_matcher"]
-        cypher_generator = services["cypher_generator"]
-
-        # Extract entities from natural language query
-        extracted_entities = cypher_generator.extract_entities_from_query(
-            search_request.query
+        # Extract and match entities, then generate Cypher (blocking LLM and
+        # full-text calls run in the threadpool)
+        entity_mappings, cypher, validation_status = await run_in_threadpool(
+            _translate_query, search_request.query, services
         )
 
-        # Match extracted entities to database entities
-        entity_mappings = entity_matcher.find_best_matches(extracted_entities)
-
-        # Generate Cypher query
-        cypher, validation_status = cypher_generator.natural_to_cypher(
-            search_request.query, entity_mappings
-        )
-
-        # Convert entity mappings to serializable format
+        # Convert entity mappings to serializable format, naming the query
+        # parameter that carries each UUID
         mappings_dict = {}
-        for key, match in entity_mappings.items():
+        for i, (key, match) in enumerate(entity_mappings.items()):
             mappings_dict[key] = {
                 "uuid": match.uuid,
+                "parameter": f"e_{i}",
                 "matched_name": match.matched_entity.get("name", "Unknown"),
                 "score": match.score,
                 "match_type": match.match_type,
             }
 
-        return CypherResponse(
-            cypher=cypher,
-            entity_mappings=mappings_dict,
-            validation_status=validation_status,
+        return _model_response(
+            CypherResponse.model_construct(
+                cypher=cypher,
+                parameters=entity_parameters(entity_mappings),
+                entity_mappings=mappings_dict,
+                validation_status=validation_status,
+            )
         )
 
     except Exception as e:
@@ -78,7 +144,7 @@ def natural_to_cypher(
 
 
 @router.post("/query", response_model=SearchResponse)
-def natural_language_query(
+async def natural_language_query(
     search_request: SearchRequest, services: Dict = Depends(get_services)
 ):
     """
@@ -91,38 +157,34 @@ def natural_language_query(
     """
     try:
         neo4j = services["neo4j"]
-        entity_matcher = services["entity_matcher"]
-        cypher_generator = services["cypher_generator"]
 
         # Start timing
         start_time = time.time()
 
-        # Extract and match entities
-        extracted_entities = cypher_generator.extract_entities_from_query(
-            search_request.query
-        )
-        entity_mappings = entity_matcher.find_best_matches(extracted_entities)
-
-        # Generate Cypher
-        cypher, _ = cypher_generator.natural_to_cypher(
-            search_request.query, entity_mappings
+        # Extract and match entities, then generate Cypher
+        entity_mappings, cypher, _ = await run_in_threadpool(
+            _translate_query, search_request.query, services
         )
 
         # Execute query with limit
-        if search_request.limit and "LIMIT" not in cypher.upper():
+        if search_request.limit and not _HAS_LIMIT_RE.search(cypher):
             cypher += f" LIMIT {search_request.limit}"
 
-        results = neo4j.execute_query(cypher)
+        parameters = entity_parameters(entity_mappings)
+        results = await neo4j.execute_query_async(cypher, parameters)
 
         # Calculate execution time
         execution_time = (time.time() - start_time) * 1000  # Convert to ms
 
-        return SearchResponse(
-            results=results,
-            cypher_used=cypher,
-            entity_mappings=entity_mappings,
-            execution_time_ms=execution_time,
-            result_count=len(results),
+        return _model_response(
+            SearchResponse.model_construct(
+                results=results,
+                cypher_used=cypher,
+                parameters=parameters,
+                entity_mappings=entity_mappings,
+                execution_time_ms=execution_time,
+                result_count=len(results),
+            )
         )
 
     except Exception as e:
@@ -130,7 +192,7 @@ def natural_language_query(
 
 
 @router.get("/test-fulltext/{entity_type}/{search_text}")
-def test_fulltext_search(
+async def test_fulltext_search(
     entity_type: str, search_text: str, services: Dict = Depends(get_services)
 ):
     """
@@ -144,7 +206,7 @@ def test_fulltext_search(
         entity_matcher = services["entity_matcher"]
 
         # Try to find match
-        match = entity_matcher.find_entity_match(entity_type, search_text)
+        match = await entity_matcher.find_entity_match_async(entity_type, search_text)
 
         if match:
             return {
@@ -166,7 +228,7 @@ def test_fulltext_search(
 
 
 @router.post("/query-graph", response_model=GraphSearchResponse)
-def natural_language_query_graph(
+async def natural_language_query_graph(
     search_request: SearchRequest,
     services: Dict = Depends(get_services),
     hipaa: bool = Query(
@@ -183,167 +245,64 @@ def natural_language_query_graph(
     """
     try:
         neo4j = services["neo4j"]
-        entity_matcher = services["entity_matcher"]
-        cypher_generator = services["cypher_generator"]
 
         # Start timing
         start_time = time.time()
 
-        # Extract and match entities
-        extracted_entities = cypher_generator.extract_entities_from_query(
-            search_request.query
-        )
-        entity_mappings = entity_matcher.find_best_matches(extracted_entities)
-
-        # Generate Cypher
-        original_cypher, _ = cypher_generator.natural_to_cypher(
-            search_request.query, entity_mappings
-        )
-
-        # Extract MATCH and WHERE clauses from original query
-        import re
-
-        # Extract everything before RETURN
-        match_pattern = re.search(
-            r"^(.*?)(?:RETURN|$)", original_cypher, re.IGNORECASE | re.DOTALL
+        # Extract and match entities, then generate Cypher
+        entity_mappings, original_cypher, _ = await run_in_threadpool(
+            _translate_query, search_request.query, services
         )
 
-        if match_pattern:
-            query_base = match_pattern.group(1).strip()
-        else:
-            query_base = original_cypher
-
-        # Extract all node variables from MATCH patterns
-        node_vars = set()
-        # Find all patterns like (var), (var:Label), or (var:Label {...})
-        # This regex captures the variable name from various node patterns
-        node_patterns = re.findall(r"\((\w+)(?::\w+)?(?:\s*\{[^}]*\})?\)", query_base)
-        node_vars.update(node_patterns)
-
-        # Build new Cypher for nodes with labels
-        if node_vars:
-            # Create RETURN clause with nodes and their labels
-            return_items = []
-            for var in sorted(node_vars):
-                return_items.append(var)
-                return_items.append(f"labels({var}) as {var}_labels")
-            return_clause = "RETURN " + ", ".join(return_items)
-            nodes_cypher = f"{query_base}\n{return_clause}"
-        else:
-            # Fallback to original if no nodes found
-            nodes_cypher = original_cypher
+        # Rewrite the query to return every matched node with its labels
+        cypher_generator = services["cypher_generator"]
+        nodes_cypher, node_vars = cypher_generator.to_graph_cypher(original_cypher)
 
         # Apply limit
-        if search_request.limit and "LIMIT" not in nodes_cypher.upper():
+        if search_request.limit and not _HAS_LIMIT_RE.search(nodes_cypher):
             nodes_cypher += f" LIMIT {search_request.limit}"
 
-        # Execute query for nodes
-        results = neo4j.execute_query(nodes_cypher)
+        # Execute query for nodes, fetching the relationships between them in
+        # the same round-trip when the node variables are known
+        parameters = entity_parameters(entity_mappings)
+        rels_result = None
+        if node_vars:
+            graph_result = await neo4j.execute_query_async(
+                _build_graph_cypher(nodes_cypher, node_vars), parameters
+            )
+            results = graph_result[0]["rows"] if graph_result else []
+            rels_result = graph_result[0]["edges"] if graph_result else []
+        else:
+            results = await neo4j.execute_query_async(nodes_cypher, parameters)
 
         # Process results into graph format
-        nodes_dict = {}  # Use dict to avoid duplicates
-        edges_list = []
+        nodes_list = list(_iter_graph_nodes(results, hipaa))
 
-        for record in results:
-            if not isinstance(record, dict):
-                continue
+        # Get relationships between result nodes if not fetched above
+        if rels_result is None and nodes_list:
+            node_uuids = [node["id"] for node in nodes_list]
+            rels_result = await get_relationships_between(neo4j, node_uuids)
 
-            # Extract all nodes from the record
-            for key, value in record.items():
-                if isinstance(value, dict) and "uuid" in value:
-                    # This is a node
-                    node_uuid = value["uuid"]
-                    if node_uuid not in nodes_dict:
-                        # Check if we have labels for this node
-                        labels_key = f"{key}_labels"
-                        if labels_key in record and isinstance(
-                            record[labels_key], list
-                        ):
-                            value["__labels__"] = record[labels_key]
-
-                        label = _determine_node_label(value)
-
-                        # Apply HIPAA masking for Patient nodes
-                        properties = {
-                            k: v
-                            for k, v in value.items()
-                            if k not in ["uuid", "__labels__"]
-                        }
-                        display_name = (
-                            value.get("name") or value.get("title") or node_uuid[:8]
-                        )
-
-                        if hipaa and label == "Patient":
-                            # Mask patient name
-                            if "name" in properties:
-                                properties["name"] = "MASKED"
-                            display_name = "MASKED"
-
-                            # Mask DOB to show only year
-                            if "dob" in properties and isinstance(
-                                properties["dob"], str
-                            ):
-                                # Keep only the year part (YYYY-**-**)
-                                year = (
-                                    properties["dob"][:4]
-                                    if len(properties["dob"]) >= 4
-                                    else "****"
-                                )
-                                properties["dob"] = f"{year}-**-**"
-
-                        nodes_dict[node_uuid] = {
-                            "id": node_uuid,
-                            "label": label,
-                            "properties": properties,
-                            "display_name": display_name,
-                        }
-
-        # Get relationships between result nodes
-        if nodes_dict:
-            node_uuids = list(nodes_dict.keys())
-
-            # Query for all relationships between these nodes
-            rels_query = """
-            MATCH (n)-[r]->(m)
-            WHERE n.uuid IN $uuids AND m.uuid IN $uuids
-            RETURN n.uuid as source, m.uuid as target, type(r) as type, properties(r) as props
-            """
-            rels_result = neo4j.execute_query(rels_query, {"uuids": node_uuids})
-
-            for rel in rels_result:
-                if isinstance(rel, dict):
-                    source = rel.get("source")
-                    target = rel.get("target")
-                    rel_type = rel.get("type")
-
-                    if source and target and rel_type:
-                        props = rel.get("props", {})
-                        if not isinstance(props, dict):
-                            props = {}
-
-                        edge_data = {
-                            "id": f"{source}-{rel_type}-{target}",
-                            "source": source,
-                            "target": target,
-                            "type": rel_type,
-                            "properties": props,
-                        }
-                        edges_list.append(edge_data)
+        edges_list = format_edges(rels_result) if nodes_list and rels_result else []
 
         # Calculate execution time
         execution_time = (time.time() - start_time) * 1000  # Convert to ms
 
-        return GraphSearchResponse(
-            nodes=list(nodes_dict.values()),
-            edges=edges_list,
-            cypher_used=nodes_cypher,  # Return the actually executed query
-            entity_mappings=entity_mappings,
-            metadata={
-                "node_count": len(nodes_dict),
-                "edge_count": len(edges_list),
-                "execution_time_ms": execution_time,
-                "original_query": search_request.query,
-            },
+        # Nodes and edges are built server-side, so skip re-validating them
+        return _model_response(
+            GraphSearchResponse.model_construct(
+                nodes=nodes_list,
+                edges=edges_list,
+                cypher_used=nodes_cypher,  # Return the actually executed query
+                parameters=parameters,
+                entity_mappings=entity_mappings,
+                metadata={
+                    "node_count": len(nodes_list),
+                    "edge_count": len(edges_list),
+                    "execution_time_ms": execution_time,
+                    "original_query": search_request.query,
+                },
+            )
         )
 
     except Exception as e:
@@ -351,19 +310,31 @@ def natural_language_query_graph(
 
 
 @router.post("/validate-cypher")
-def validate_cypher(cypher_query: str, services: Dict = Depends(get_services)):
+async def validate_cypher(
+    cypher_query: str,
+    parameters: Optional[Dict[str, Any]] = Body(
+        None, description="Query parameters, e.g. the parameters from /to-cypher"
+    ),
+    services: Dict = Depends(get_services),
+):
     """
     Validate a Cypher query without executing it
 
     Args:
         cypher_query: Cypher query to validate
+        parameters: Values for the $name parameters the query refers to
     """
+    # Reject empty or oversized queries without a database round-trip
+    error = _precheck_cypher(cypher_query)
+    if error:
+        return {"valid": False, "error": error}
+
     try:
         neo4j = services["neo4j"]
 
         # Try EXPLAIN to validate
         explain_query = f"EXPLAIN {cypher_query}"
-        neo4j.execute_query(explain_query)
+        await neo4j.execute_query_async(explain_query, parameters)
 
         return {"valid": True, "message": "Query is valid"}
 
@@ -371,62 +342,185 @@ def validate_cypher(cypher_query: str, services: Dict = Depends(get_services)):
         return {"valid": False, "error": str(e)}
 
 
-def _determine_node_label(node: dict) -> str:
-    """Determine node label from its properties or metadata"""
+def _precheck_cypher(cypher: str) -> Optional[str]:
+    """
+    Return an error message if the query is empty or too long
 
-    # Priority 1: Use Neo4j label metadata if available
-    if "__labels__" in node and isinstance(node["__labels__"], list):
-        if node["__labels__"]:
-            return node["__labels__"][0]
+    Syntax is left to EXPLAIN, since local checks cannot tell brackets in
+    string literals, comments or escaped names from real ones.
+    """
+    if not cypher.strip():
+        return "Query is empty"
+    if len(cypher) > MAX_CYPHER_LENGTH:
+        return f"Query exceeds {MAX_CYPHER_LENGTH} characters"
+    return None
 
-    if "__label__" in node:
-        return node["__label__"]
 
-    # Priority 2: Infer from properties (more flexible rules)
+def _iter_graph_nodes(records: Iterable[Dict], hipaa: bool) -> Iterator[Dict]:
+    """Yield each distinct node found in the result records in graph format"""
+    seen = set()
 
-    # Patient: has date of birth
-    if "dob" in node:
-        return "Patient"
+    for record in records:
+        if not isinstance(record, dict):
+            continue
 
-    # Clinician: has specialty or npi
-    if "specialty" in node or "npi" in node:
-        return "Clinician"
+        # Extract all nodes from the record
+        for key, value in record.items():
+            if not isinstance(value, dict) or "uuid" not in value:
+                continue
 
-    # Encounter: has date with reason or department
-    if "date" in node:
-        if "reason" in node or "dept" in node:
-            return "Encounter"
+            # This is a node
+            node_uuid = value["uuid"]
+            if node_uuid in seen:
+                continue
+            seen.add(node_uuid)
+
+            # Check if we have labels for this node
+            labels_key = f"{key}_labels"
+            if labels_key in record and isinstance(record[labels_key], list):
+                value["__labels__"] = record[labels_key]
+
+            label = _determine_node_label(value)
+
+            # Apply HIPAA masking for Patient nodes
+            properties = value.copy()
+            properties.pop("uuid", None)
+            properties.pop("__labels__", None)
+            display_name = value.get("name") or value.get("title") or node_uuid[:8]
+
+            if hipaa and label == "Patient":
+                # Mask patient name
+                if "name" in properties:
+                    properties["name"] = "MASKED"
+                display_name = "MASKED"
+
+                # Mask DOB to show only year
+                if "dob" in properties and isinstance(properties["dob"], str):
+                    # Keep only the year part (YYYY-**-**)
+                    year = (
+                        properties["dob"][:4] if len(properties["dob"]) >= 4 else "****"
+                    )
+                    properties["dob"] = f"{year}-**-**"
+
+            yield {
+                "id": node_uuid,
+                "label": label,
+                "properties": properties,
+                "display_name": display_name,
+            }
 
-    # TestResult: has value and/or unit
-    if "value" in node or ("unit" in node and "ref_low" in node):
-        return "TestResult"
 
-    # Test: has loinc or is named like a test
-    if "loinc" in node or "category" in node:
-        return "Test"
+def _build_graph_cypher(nodes_cypher: str, node_vars: Tuple[str, ...]) -> str:
+    """
+    Wrap a node query so its rows and the relationships between the returned
+    nodes come back in a single record ({rows, edges})
 
-    # Code-based entities (Disease, Medication, Procedure, Symptom)
-    if "code" in node:
-        system = node.get("system", "")
-        if "ICD" in system.upper():
-            return "Disease"
-        elif "RXNORM" in system.upper():
-            return "Medication"
-        elif "CPT" in system.upper() or "HCPCS" in system.upper():
-            return "Procedure"
-        elif "SNOMED" in system.upper():
-            return "Symptom"
-        else:
-            # Generic coded entity
-            return "ClinicalConcept"
+    Edges are [source, target, type, props] lists, the row shape format_edges
+    expects. collect() skips nulls, so the CASE keeps an unmatched OPTIONAL
+    MATCH from adding an all-null edge.
+    """
+    row_map = ", ".join(
+        f"{var}: {var}, {var}_labels: {var}_labels" for var in node_vars
+    )
+    uuids = " + ".join(f"[row IN rows | row.{var}.uuid]" for var in node_vars)
+
+    return f"""CALL {{
+{nodes_cypher}
+}}
+WITH collect({{{row_map}}}) AS rows
+WITH rows, {uuids} AS uuids
+OPTIONAL MATCH (n)-[r]->(m)
+WHERE n.uuid IN uuids AND m.uuid IN uuids
+RETURN rows, collect(CASE WHEN r IS NOT NULL THEN [n.uuid, m.uuid, type(r), properties(r)] END) AS edges"""
+
+
+# Coding system fragments mapped to labels for code-based entities, in
+# priority order
+_SYSTEM_LABELS = (
+    ("ICD", "Disease"),
+    ("RXNORM", "Medication"),
+    ("CPT", "Procedure"),
+    ("HCPCS", "Procedure"),
+    ("SNOMED", "Symptom"),
+)
 
-    # Document-like entities
-    if "title" in node or "content" in node:
-        return "Document"
+# Property names that the label rules below discriminate on
+_LABEL_KEYS = frozenset(
+    {
+        "dob",
+        "specialty",
+        "npi",
+        "date",
+        "reason",
+        "dept",
+        "value",
+        "unit",
+        "ref_low",
+        "loinc",
+        "category",
+        "code",
+        "title",
+        "content",
+        "source_id",
+        "source_type",
+    }
+)
 
+# (predicate, label) rules for inferring a label from the discriminating
+# properties present on a node, checked in order. A label of None means
+# "resolve from the coding system".
+_LABEL_RULES = (
+    # Patient: has date of birth
+    (lambda keys: "dob" in keys, "Patient"),
+    # Clinician: has specialty or npi
+    (lambda keys: "specialty" in keys or "npi" in keys, "Clinician"),
+    # Encounter: has date with reason or department
+    (
+        lambda keys: "date" in keys and ("reason" in keys or "dept" in keys),
+        "Encounter",
+    ),
+    # TestResult: has value and/or unit
+    (
+        lambda keys: "value" in keys or ("unit" in keys and "ref_low" in keys),
+        "TestResult",
+    ),
+    # Test: has loinc or is named like a test
+    (lambda keys: "loinc" in keys or "category" in keys, "Test"),
+    # Code-based entities (Disease, Medication, Procedure, Symptom)
+    (lambda keys: "code" in keys, None),
+    # Document-like entities
+    (lambda keys: "title" in keys or "content" in keys, "Document"),
     # Source document
-    if "source_id" in node or "source_type" in node:
-        return "SourceDocument"
+    (lambda keys: "source_id" in keys or "source_type" in keys, "SourceDocument"),
+)
+
+
+def _determine_node_label(node: dict) -> str:
+    """Determine node label from its properties or metadata"""
+
+    # Priority 1: Use Neo4j label metadata if available
+    labels = node.get("__labels__")
+    if labels and isinstance(labels, list):
+        return labels[0]
+
+    if "__label__" in node:
+        return node["__label__"]
+
+    # Priority 2: Infer from properties (more flexible rules)
+    present = node.keys() & _LABEL_KEYS
+    for predicate, label in _LABEL_RULES:
+        if predicate(present):
+            return label or _label_from_system(node.get("system"))
 
     # Default: Generic entity instead of Unknown
     return "Entity"
+
+
+def _label_from_system(system: str) -> str:
+    """Map a coding system name to a node label"""
+    system_upper = (system or "").upper()
+    return next(
+        (label for fragment, label in _SYSTEM_LABELS if fragment in system_upper),
+        # Generic coded entity
+        "ClinicalConcept",
+    )
@@ -1,13 +1,23 @@
 """PostgreSQL database connection and setup"""
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.config import settings
 
-# Create engine
-engine = create_engine(settings.postgres_url)
+# Create engine with a persistent connection pool; pre-ping drops
+# connections the server closed while idle. Bulk inserts go out as multi-row
+# VALUES pages and other executemany calls as psycopg2 execute_batch pages
+engine = create_engine(
+    settings.postgres_url,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
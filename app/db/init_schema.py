@@ -2,187 +2,354 @@
 Initialize database schemas for both Neo4j and PostgreSQL
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, Hashable, List, Set, Tuple
+import io
+import sys
+import threading
 from app.db.neo4j import Neo4jConnection
 from app.db.database import engine, Base
 from sqlalchemy import text
 
 
-def drop_all_constraints_and_indexes(neo4j: Neo4jConnection):
-    """Drop all existing constraints and indexes"""
-    print("Dropping all existing constraints and indexes...")
-
-    # Get all constraints
-    try:
-        constraints = neo4j.execute_query("SHOW CONSTRAINTS")
-        for constraint in constraints:
-            name = constraint.get("name")
-            if name:
-                try:
-                    neo4j.execute_query(f"DROP CONSTRAINT {name}")
-                    print(f"  Dropped constraint: {name}")
-                except Exception as e:
-                    print(f"  Failed to drop constraint {name}: {e}")
-    except Exception as e:
-        print(f"  Error listing constraints: {e}")
+def fetch_existing_schema(neo4j: Neo4jConnection) -> List[Dict]:
+    """
+    Existing constraints and user-defined indexes
+
+    Each record has kind ("constraint" or "index"), name, type, labelsOrTypes
+    and properties. Constraint-backed and token lookup indexes are left out,
+    as they are not managed on their own.
+    """
+    existing = []
+    for kind, query in (
+        ("constraint", "SHOW CONSTRAINTS YIELD name, type, labelsOrTypes, properties"),
+        (
+            "index",
+            "SHOW INDEXES YIELD name, type, labelsOrTypes, properties, owningConstraint "
+            "WHERE owningConstraint IS NULL AND type <> 'LOOKUP' "
+            "RETURN name, type, labelsOrTypes, properties",
+        ),
+    ):
+        try:
+            existing.extend(
+                {"kind": kind, **record} for record in neo4j.execute_query(query)
+            )
+        except Exception as e:
+            print(f"  Error listing schema: {e}")
+    return existing
+
+
+def _schema_keys(record: Dict) -> List[Hashable]:
+    """
+    Keys an existing item is recognised by: its name, plus a (kind, label,
+    properties) tuple per label
+
+    The kind keeps a range index on n.uuid from passing for the uuid
+    uniqueness constraint, and the reverse. A full-text index only counts as
+    a declared one when its name, labels and properties all match, so it is
+    keyed by all three together.
+    """
+    labels = record.get("labelsOrTypes") or []
+    properties = tuple(record.get("properties") or [])
+    if record.get("type") == "FULLTEXT":
+        return [(record["name"], "fulltext", tuple(labels), properties)]
+
+    return [record["name"]] + [(record["kind"], label, properties) for label in labels]
+
+
+def drop_stale_schema(neo4j: Neo4jConnection, existing: List[Dict]) -> Set[Hashable]:
+    """
+    Drop constraints, range and full-text indexes that are not declared below
+
+    An item is kept when its name or its (kind, label, properties) matches a
+    declared item, so a warm restart leaves the schema untouched; full-text
+    indexes must match on all of those. Other index types (vector, text,
+    point) are never dropped.
+
+    Returns:
+        Names and (kind, label, properties) keys of the items that remain, for
+        _create_schema_items to skip
+    """
+    print("Dropping undeclared constraints and indexes...")
+
+    kept: Set[Hashable] = set()
+    stale = []
+    for record in existing:
+        keys = _schema_keys(record)
+        if record["kind"] == "index" and record.get("type") not in _MANAGED_INDEX_TYPES:
+            kept.update(keys)
+        elif any(key in _DECLARED_KEYS for key in keys):
+            kept.update(keys)
+        else:
+            stale.append(record)
+
+    _execute_schema_batch(
+        neo4j,
+        [
+            (
+                f"DROP {record['kind'].upper()} {record['name']}",
+                f"{record['kind']}: {record['name']}",
+            )
+            for record in stale
+        ],
+        "Dropped",
+        "drop",
+    )
+    return kept
+
+
+def _create_schema_items(
+    neo4j: Neo4jConnection,
+    items: List[Tuple[str, Tuple, str, str]],
+    existing: Set[Hashable],
+):
+    """
+    Create missing constraints/indexes in a single transaction
+
+    Args:
+        items: (name, definition key, DDL query, description) per item
+        existing: Result of drop_stale_schema, one snapshot taken before any
+            DDL; matching items are skipped without a round-trip
+    """
+    missing = []
+    for name, definition, query, description in items:
+        if name in existing or definition in existing:
+            print(f"  ○ Already exists: {description}")
+        else:
+            missing.append((query, description))
+
+    _execute_schema_batch(neo4j, missing, "Created", "create")
+
+
+def _execute_schema_batch(
+    neo4j: Neo4jConnection, statements: List[Tuple[str, str]], done: str, verb: str
+):
+    """
+    Run DDL statements in a single transaction, reporting each one
+
+    Args:
+        statements: (DDL query, description) pairs
+        done: Past-tense word for log lines, e.g. "Created"
+        verb: Verb for failure lines, e.g. "create"
+    """
+    if not statements:
+        return
 
-    # Get all indexes
     try:
-        indexes = neo4j.execute_query("SHOW INDEXES")
-        for index in indexes:
-            name = index.get("name")
-            # Skip constraint-backed indexes and token lookup indexes
-            if (
-                name
-                and not name.startswith("constraint_")
-                and "token_lookup" not in name
-            ):
-                try:
-                    neo4j.execute_query(f"DROP INDEX {name}")
-                    print(f"  Dropped index: {name}")
-                except Exception as e:
-                    print(f"  Failed to drop index {name}: {e}")
+        neo4j.execute_many([query for query, _ in statements])
+        for _, description in statements:
+            print(f"  ✓ {done} {description}")
     except Exception as e:
-        print(f"  Error listing indexes: {e}")
+        # Fall back to one statement at a time to report which item failed
+        print(f"  Batch {verb} failed ({e}), retrying individually")
+        for query, description in statements:
+            try:
+                neo4j.execute_query(query)
+                print(f"  ✓ {done} {description}")
+            except Exception as e:
+                print(f"  ✗ Failed to {verb} {description}: {e}")
+
+
+# DDL templates; labels and property names cannot be parameterized
+_UUID_CONSTRAINT_TMPL = (
+    "CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.uuid IS UNIQUE"
+)
+_INDEX_TMPL = "CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON ({props})"
+_FULLTEXT_INDEX_TMPL = (
+    "CREATE FULLTEXT INDEX {name} IF NOT EXISTS FOR (n:{label}) ON EACH [{props}]"
+)
+
+UUID_CONSTRAINT_LABELS = [
+    "Patient",
+    "Encounter",
+    "Clinician",
+    "TestResult",  # Instance nodes
+    "Symptom",
+    "Disease",
+    "Test",
+    "Medication",
+    "Procedure",
+    "Guideline",  # Catalog nodes
+]
+
+FULLTEXT_INDEXES = [
+    ("patient_search", "Patient", ["name"]),
+    ("clinician_search", "Clinician", ["name", "specialty"]),
+    ("disease_search", "Disease", ["name", "code"]),
+    ("symptom_search", "Symptom", ["name", "code"]),
+    ("medication_search", "Medication", ["name", "code"]),
+    ("procedure_search", "Procedure", ["name", "code"]),
+    ("test_search", "Test", ["name", "loinc"]),
+]
+
+# Code+System composite indexes for catalog nodes
+CATALOG_COMPOSITE_INDEXES = [
+    ("Disease", ["code", "system"]),
+    ("Medication", ["code", "system"]),
+    ("Procedure", ["code", "system"]),
+]
+
+# Single property indexes
+CATALOG_PROPERTY_INDEXES = [
+    ("Symptom", "code"),
+    ("Symptom", "system"),
+    ("Symptom", "name"),
+    ("Disease", "code"),
+    ("Disease", "name"),
+    ("Test", "name"),
+    ("Test", "loinc"),
+    ("Medication", "code"),
+    ("Medication", "name"),
+    ("Procedure", "code"),
+    ("Procedure", "name"),
+    ("Clinician", "name"),
+    ("Guideline", "title"),
+    ("Encounter", "date"),
+    ("TestResult", "time"),
+    ("Patient", "sex"),
+]
+
+# Starting points for the label-qualified queries the Cypher generator writes
+# (properties from its schema prompt that are filtered on but not covered by
+# the catalog indexes), so those MATCHes begin with an index seek rather
+# than a label scan
+TRAVERSAL_INDEXES = [
+    ("Patient", "name"),
+    ("Patient", "dob"),
+    ("Encounter", "dept"),
+    ("Clinician", "specialty"),
+    ("TestResult", "value"),
+]
+
+
+def _node_props(properties: List[str]) -> str:
+    """Render property names as n.prop references"""
+    return ", ".join(f"n.{prop}" for prop in properties)
+
+
+# Schema items are static, so the DDL is rendered once at import.
+# Each item is (name, (kind, label, properties), DDL query, description).
+_UUID_CONSTRAINTS = [
+    (
+        f"{label.lower()}_uuid_unique",
+        ("constraint", label, ("uuid",)),
+        _UUID_CONSTRAINT_TMPL.format(name=f"{label.lower()}_uuid_unique", label=label),
+        f"UUID constraint for {label}",
+    )
+    for label in UUID_CONSTRAINT_LABELS
+]
+
+_COMPOSITE_INDEXES = [
+    (
+        f"{label.lower()}_{'_'.join(properties)}_idx",
+        ("index", label, tuple(properties)),
+        _INDEX_TMPL.format(
+            name=f"{label.lower()}_{'_'.join(properties)}_idx",
+            label=label,
+            props=_node_props(properties),
+        ),
+        f"composite index for {label} on {properties}",
+    )
+    for label, properties in CATALOG_COMPOSITE_INDEXES
+]
+
+
+def _property_index_items(indexes: List[Tuple[str, str]]) -> List[Tuple]:
+    """Schema items for single property indexes given as (label, property)"""
+    return [
+        (
+            f"{label.lower()}_{prop}_idx",
+            ("index", label, (prop,)),
+            _INDEX_TMPL.format(
+                name=f"{label.lower()}_{prop}_idx",
+                label=label,
+                props=_node_props([prop]),
+            ),
+            f"{prop} index for {label}",
+        )
+        for label, prop in indexes
+    ]
 
 
-def create_uuid_constraints(neo4j: Neo4jConnection):
+_PROPERTY_INDEXES = _property_index_items(CATALOG_PROPERTY_INDEXES)
+_TRAVERSAL_INDEXES = _property_index_items(TRAVERSAL_INDEXES)
+
+# Full-text items are keyed by name, label and properties together; see
+# _schema_keys
+_FULLTEXT_INDEX_ITEMS = [
+    (
+        name,
+        (name, "fulltext", (label,), tuple(properties)),
+        _FULLTEXT_INDEX_TMPL.format(
+            name=name, label=label, props=_node_props(properties)
+        ),
+        f"full-text index: {name}",
+    )
+    for name, label, properties in FULLTEXT_INDEXES
+]
+
+# Keys of every declared item, matched against _schema_keys of listed items
+_DECLARED_KEYS = {
+    key
+    for name, definition, _, _ in _UUID_CONSTRAINTS
+    + _COMPOSITE_INDEXES
+    + _PROPERTY_INDEXES
+    + _TRAVERSAL_INDEXES
+    for key in (name, definition)
+} | {definition for _, definition, _, _ in _FULLTEXT_INDEX_ITEMS}
+
+# Index types drop_stale_schema manages; any other type is left in place
+_MANAGED_INDEX_TYPES = ("RANGE", "FULLTEXT")
+
+
+def create_uuid_constraints(neo4j: Neo4jConnection, existing: Set[Hashable]):
     """Create UUID uniqueness constraints for all node types"""
     print("\nCreating UUID constraints...")
 
-    node_labels = [
-        "Patient",
-        "Encounter",
-        "Clinician",
-        "TestResult",  # Instance nodes
-        "Symptom",
-        "Disease",
-        "Test",
-        "Medication",
-        "Procedure",
-        "Guideline",  # Catalog nodes
-    ]
+    _create_schema_items(neo4j, _UUID_CONSTRAINTS, existing)
 
-    for label in node_labels:
-        try:
-            constraint_name = f"{label.lower()}_uuid_unique"
-            query = f"""
-            CREATE CONSTRAINT {constraint_name}
-            IF NOT EXISTS
-            FOR (n:{label})
-            REQUIRE n.uuid IS UNIQUE
-            """
-            neo4j.execute_query(query)
-            print(f"  ✓ Created UUID constraint for {label}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  ○ UUID constraint already exists for {label}")
-            else:
-                print(f"  ✗ Failed to create UUID constraint for {label}: {e}")
 
+def create_fulltext_indexes(neo4j: Neo4jConnection, existing: Set[Hashable]):
+    """
+    Create full-text indexes for fuzzy search
 
-def create_fulltext_indexes(neo4j: Neo4jConnection):
-    """Create full-text indexes for fuzzy search"""
+    Indexes that already match are skipped, since creating one repopulates
+    it from every node with the label.
+    """
     print("\nCreating full-text search indexes...")
 
-    fulltext_indexes = [
-        ("patient_search", "Patient", ["name"]),
-        ("clinician_search", "Clinician", ["name", "specialty"]),
-        ("disease_search", "Disease", ["name", "code"]),
-        ("symptom_search", "Symptom", ["name", "code"]),
-        ("medication_search", "Medication", ["name", "code"]),
-        ("procedure_search", "Procedure", ["name", "code"]),
-        ("test_search", "Test", ["name", "loinc"]),
-    ]
+    _create_schema_items(neo4j, _FULLTEXT_INDEX_ITEMS, existing)
 
-    for index_name, label, properties in fulltext_indexes:
-        try:
-            # Drop existing index if it exists
-            try:
-                neo4j.execute_query(f"DROP INDEX {index_name}")
-            except Exception:
-                pass  # Index doesn't exist, which is fine
-
-            # Create full-text index
-            props_str = ", ".join([f"n.{prop}" for prop in properties])
-            query = f"""
-            CREATE FULLTEXT INDEX {index_name}
-            FOR (n:{label})
-            ON EACH [{props_str}]
-            """
-            neo4j.execute_query(query)
-            print(f"  ✓ Created full-text index: {index_name}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  ○ Full-text index already exists: {index_name}")
-            else:
-                print(f"  ✗ Failed to create full-text index {index_name}: {e}")
 
-
-def create_catalog_indexes(neo4j: Neo4jConnection):
+def create_catalog_indexes(neo4j: Neo4jConnection, existing: Set[Hashable]):
     """Create indexes for catalog node lookups"""
     print("\nCreating catalog node indexes...")
 
-    # Code+System composite indexes for catalog nodes
-    catalog_composite = [
-        ("Disease", ["code", "system"]),
-        ("Medication", ["code", "system"]),
-        ("Procedure", ["code", "system"]),
-    ]
+    _create_schema_items(neo4j, _COMPOSITE_INDEXES, existing)
+    _create_schema_items(neo4j, _PROPERTY_INDEXES, existing)
 
-    for label, properties in catalog_composite:
-        try:
-            index_name = f"{label.lower()}_{'_'.join(properties)}_idx"
-            prop_list = ", ".join([f"n.{prop}" for prop in properties])
-            query = f"""
-            CREATE INDEX {index_name}
-            IF NOT EXISTS
-            FOR (n:{label})
-            ON ({prop_list})
-            """
-            neo4j.execute_query(query)
-            print(f"  ✓ Created composite index for {label} on {properties}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  ○ Composite index already exists for {label} on {properties}")
-            else:
-                print(f"  ✗ Failed to create composite index for {label}: {e}")
-
-    # Single property indexes
-    single_indexes = [
-        ("Symptom", "code"),
-        ("Symptom", "system"),
-        ("Symptom", "name"),
-        ("Disease", "code"),
-        ("Disease", "name"),
-        ("Test", "name"),
-        ("Test", "loinc"),
-        ("Medication", "code"),
-        ("Medication", "name"),
-        ("Procedure", "code"),
-        ("Procedure", "name"),
-        ("Clinician", "name"),
-        ("Guideline", "title"),
-        ("Encounter", "date"),
-        ("TestResult", "time"),
-        ("Patient", "sex"),
-    ]
 
-    for label, prop in single_indexes:
-        try:
-            index_name = f"{label.lower()}_{prop}_idx"
-            query = f"""
-            CREATE INDEX {index_name}
-            IF NOT EXISTS
-            FOR (n:{label})
-            ON (n.{prop})
-            """
-            neo4j.execute_query(query)
-            print(f"  ✓ Created {prop} index for {label}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"  ○ Index already exists for {label}.{prop}")
-            else:
-                print(f"  ✗ Failed to create index for {label}.{prop}: {e}")
+def create_traversal_indexes(neo4j: Neo4jConnection, existing: Set[Hashable]):
+    """Create indexes on the properties that graph queries start from"""
+    print("\nCreating traversal indexes...")
+
+    _create_schema_items(neo4j, _TRAVERSAL_INDEXES, existing)
+
+
+# Schema counts, filtered and aggregated by the server. User-defined indexes
+# are those not backing a constraint and not token lookup indexes.
+CONSTRAINT_COUNTS_QUERY = """
+SHOW CONSTRAINTS YIELD properties
+RETURN count(*) as total,
+       count(CASE WHEN 'uuid' IN properties THEN 1 END) as uuid_constraints
+"""
+INDEX_COUNTS_QUERY = """
+SHOW INDEXES YIELD type, owningConstraint
+RETURN count(*) as total,
+       count(CASE WHEN owningConstraint IS NULL AND type <> 'LOOKUP' THEN 1 END)
+           as user_indexes
+"""
 
 
 def verify_schema(neo4j: Neo4jConnection):
@@ -191,31 +358,40 @@ def verify_schema(neo4j: Neo4jConnection):
 
     try:
         # Check constraints
-        constraints = neo4j.execute_query("SHOW CONSTRAINTS")
-        uuid_constraints = [c for c in constraints if "uuid" in c.get("properties", [])]
-        print(f"  Found {len(uuid_constraints)} UUID constraints")
+        constraints = neo4j.execute_query(CONSTRAINT_COUNTS_QUERY)[0]
+        print(f"  Found {constraints['uuid_constraints']} UUID constraints")
 
         # Check indexes
-        indexes = neo4j.execute_query("SHOW INDEXES")
-        user_indexes = [
-            i
-            for i in indexes
-            if not i.get("name", "").startswith("constraint_")
-            and "token_lookup" not in i.get("name", "")
-        ]
-        print(f"  Found {len(user_indexes)} user-defined indexes")
+        indexes = neo4j.execute_query(INDEX_COUNTS_QUERY)[0]
+        print(f"  Found {indexes['user_indexes']} user-defined indexes")
 
         return {
-            "uuid_constraints": len(uuid_constraints),
-            "indexes": len(user_indexes),
-            "total_constraints": len(constraints),
-            "total_indexes": len(indexes),
+            "uuid_constraints": constraints["uuid_constraints"],
+            "indexes": indexes["user_indexes"],
+            "total_constraints": constraints["total"],
+            "total_indexes": indexes["total"],
         }
     except Exception as e:
         print(f"  Error verifying schema: {e}")
         return {}
 
 
+# HNSW keeps similarity search over chunk embeddings from scanning every row;
+# the document_id index covers the chunks -> documents join
+POSTGRES_INDEXES = [
+    (
+        "chunks_embedding_hnsw",
+        "CREATE INDEX IF NOT EXISTS chunks_embedding_hnsw ON chunks "
+        "USING hnsw (embedding halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)",
+    ),
+    (
+        "chunks_document_id_idx",
+        "CREATE INDEX IF NOT EXISTS chunks_document_id_idx ON chunks (document_id)",
+    ),
+]
+
+
 def init_postgres_schema():
     """Initialize PostgreSQL schema with pgvector"""
     print("\n" + "=" * 60)
@@ -237,7 +413,31 @@ def init_postgres_schema():
         print("\nCreating PostgreSQL tables...")
         Base.metadata.create_all(bind=engine)
         print("  ✓ documents table created")
-        print("  ✓ chunks table created (with vector embeddings)")
+        print("  ✓ chunks table created (with halfvec embeddings)")
+
+        # Create indexes
+        print("\nCreating PostgreSQL indexes...")
+        with engine.connect() as conn:
+            # Tables created before embeddings were stored as halfvec keep
+            # their full-precision column until converted
+            column_type = conn.execute(
+                text("""
+                SELECT udt_name
+                FROM information_schema.columns
+                WHERE table_name = 'chunks' AND column_name = 'embedding'
+            """)
+            ).scalar()
+            if column_type == "vector":
+                conn.execute(text("DROP INDEX IF EXISTS chunks_embedding_hnsw"))
+                conn.execute(
+                    text("ALTER TABLE chunks ALTER COLUMN embedding TYPE halfvec(1024)")
+                )
+                print("  ✓ chunks.embedding converted to halfvec")
+
+            for name, statement in POSTGRES_INDEXES:
+                conn.execute(text(statement))
+                print(f"  ✓ {name}")
+            conn.commit()
 
         # Verify tables
         with engine.connect() as conn:
@@ -275,17 +475,21 @@ def init_neo4j_schema():
     neo4j = Neo4jConnection()
 
     try:
-        # Drop all existing constraints and indexes
-        drop_all_constraints_and_indexes(neo4j)
+        # Read the schema once, drop what is no longer declared and diff the
+        # rest locally, so a warm restart changes nothing
+        existing = drop_stale_schema(neo4j, fetch_existing_schema(neo4j))
 
         # Create new UUID-based constraints
-        create_uuid_constraints(neo4j)
+        create_uuid_constraints(neo4j, existing)
 
         # Create catalog lookup indexes
-        create_catalog_indexes(neo4j)
+        create_catalog_indexes(neo4j, existing)
+
+        # Create indexes for query starting points
+        create_traversal_indexes(neo4j, existing)
 
         # Create full-text search indexes
-        create_fulltext_indexes(neo4j)
+        create_fulltext_indexes(neo4j, existing)
 
         # Verify the schema
         stats = verify_schema(neo4j)
@@ -311,21 +515,27 @@ def init_schema():
 
     results = {}
 
-    # Initialize PostgreSQL
-    try:
-        postgres_result = init_postgres_schema()
-        results["postgres"] = postgres_result
-    except Exception as e:
-        print(f"PostgreSQL initialization failed: {e}")
-        results["postgres"] = False
+    # The two databases are independent, so initialize them concurrently;
+    # each one's output is buffered and printed as a block afterwards
+    initializers = [
+        ("postgres", "PostgreSQL", init_postgres_schema),
+        ("neo4j", "Neo4j", init_neo4j_schema),
+    ]
+    stdout = _PerThreadStdout(sys.stdout)
+    with redirect_stdout(stdout), ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            (key, name, executor.submit(stdout.capture, init))
+            for key, name, init in initializers
+        ]
 
-    # Initialize Neo4j
-    try:
-        neo4j_result = init_neo4j_schema()
-        results["neo4j"] = neo4j_result
-    except Exception as e:
-        print(f"Neo4j initialization failed: {e}")
-        results["neo4j"] = False
+    for key, name, future in futures:
+        result, output = future.result()
+        print(output, end="")
+        if isinstance(result, Exception):
+            print(f"{name} initialization failed: {result}")
+            results[key] = False
+        else:
+            results[key] = result
 
     # Final summary
     print("\n" + "=" * 60)
@@ -347,5 +557,28 @@ def init_schema():
     return results
 
 
+class _PerThreadStdout(io.TextIOBase):
+    """stdout replacement that sends each capturing thread's output to a buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self._stream).write(text)
+
+    def capture(self, func: Callable[[], Any]) -> Tuple[Any, str]:
+        """Run func, returning (result or raised exception, captured output)"""
+        self._local.buffer = io.StringIO()
+        try:
+            result = func()
+        except Exception as e:
+            result = e
+        finally:
+            output = self._local.buffer.getvalue()
+            del self._local.buffer
+        return result, output
+
+
 if __name__ == "__main__":
     init_schema()
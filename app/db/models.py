@@ -1,10 +1,11 @@
 """PostgreSQL database models"""
 
-from sqlalchemy import Column, Integer, Text, ForeignKey
+from typing import Dict, List, Optional
+from sqlalchemy import Integer, Text, ForeignKey, insert
 from sqlalchemy.dialects.postgresql import UUID
-from pgvector.sqlalchemy import Vector
-from sqlalchemy.orm import relationship
-import uuid
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
+import uuid as uuid_pkg
 
 from app.db.database import Base
 
@@ -14,12 +15,15 @@ class Document(Base):
 
     __tablename__ = "documents"
 
-    uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    text = Column(Text, nullable=False)
+    uuid: Mapped[uuid_pkg.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid_pkg.uuid4
+    )
+    # Full text is only needed when explicitly accessed
+    text: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
 
     # Relationship to chunks
-    chunks = relationship(
-        "Chunk", back_populates="document", cascade="all, delete-orphan"
+    chunks: Mapped[List["Chunk"]] = relationship(
+        back_populates="document", cascade="all, delete-orphan"
     )
 
 
@@ -28,13 +32,31 @@ class Chunk(Base):
 
     __tablename__ = "chunks"
 
-    uuid = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    document_id = Column(
+    uuid: Mapped[uuid_pkg.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid_pkg.uuid4
+    )
+    document_id: Mapped[uuid_pkg.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("documents.uuid"), nullable=False
     )
-    chunk_index = Column(Integer, nullable=False)
-    text = Column(Text, nullable=False)
-    embedding = Column(Vector(1024), nullable=True)  # voyage-3.5 dimension
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    # Half precision halves storage and scan bandwidth; deferred so loading
+    # chunks does not pull 1024 values per row
+    embedding: Mapped[Optional[list]] = mapped_column(
+        HALFVEC(1024), nullable=True, deferred=True
+    )  # voyage-3.5 dimension
 
     # Relationship to document
-    document = relationship("Document", back_populates="chunks")
+    document: Mapped["Document"] = relationship(back_populates="chunks")
+
+
+def bulk_insert_chunks(session: Session, rows: List[Dict]) -> None:
+    """
+    Insert chunk rows in batched multi-row INSERTs
+
+    Args:
+        session: Open session; rows are written in its current transaction
+        rows: Dicts with document_id, chunk_index, text and embedding keys
+    """
+    if rows:
+        session.execute(insert(Chunk), rows)
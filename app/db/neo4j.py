@@ -1,17 +1,96 @@
-from neo4j import GraphDatabase
-from typing import Dict, List, Optional
+"""
+Neo4j connection wrapper
+
+Queries must pass values through `parameters` rather than formatting them into
+the query text: Neo4j caches plans by exact query string, so interpolated values
+cause a re-plan on every call (and invite injection). Only labels, relationship
+types and schema names, which Cypher cannot parameterize, may be formatted in.
+"""
+
+import asyncio
+import atexit
+import threading
+import time
+from neo4j import READ_ACCESS, AsyncDriver, AsyncGraphDatabase, Driver, GraphDatabase
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from loguru import logger
 from app.config import settings
 
 
+def _driver_config() -> Dict:
+    """Connection and pool options shared by the sync and async drivers"""
+    return {
+        "auth": (settings.neo4j_user, settings.neo4j_password),
+        "max_connection_pool_size": settings.neo4j_max_connection_pool_size,
+        "connection_acquisition_timeout": settings.neo4j_connection_acquisition_timeout,
+        "max_connection_lifetime": settings.neo4j_max_connection_lifetime,
+        "keep_alive": True,
+        "fetch_size": settings.neo4j_fetch_size,
+    }
+
+
+# Seconds a successful test_connection is reused before checking again
+CONNECTION_TEST_TTL = 5.0
+
+# Sync drivers shared by every Neo4jConnection in the process, keyed by
+# (uri, user), so each connection object reuses one warm pool
+_drivers: Dict[Tuple[str, str], Driver] = {}
+_drivers_lock = threading.Lock()
+
+
+def _shared_driver() -> Driver:
+    """Sync driver for the configured database, created on first use"""
+    key = (settings.neo4j_uri, settings.neo4j_user)
+    with _drivers_lock:
+        driver = _drivers.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(settings.neo4j_uri, **_driver_config())
+            _drivers[key] = driver
+        return driver
+
+
+@atexit.register
+def _close_drivers():
+    """Close the shared sync drivers when the process exits"""
+    with _drivers_lock:
+        for driver in _drivers.values():
+            driver.close()
+        _drivers.clear()
+
+
 class Neo4jConnection:
     def __init__(self):
-        self.driver = GraphDatabase.driver(
-            settings.neo4j_uri, auth=(settings.neo4j_user, settings.neo4j_password)
-        )
+        self.driver = _shared_driver()
+        self._async_driver: Optional[AsyncDriver] = None
+        # Queue excess async queries here rather than timing out on the pool
+        self._async_limit = asyncio.Semaphore(settings.neo4j_max_concurrency)
+        self._stream_limit = asyncio.Semaphore(settings.neo4j_max_streams)
+        # Monotonic time of the last successful test_connection
+        self._last_ok = float("-inf")
+
+    @property
+    def async_driver(self) -> AsyncDriver:
+        """Async driver, created on first use inside the running event loop"""
+        if self._async_driver is None:
+            self._async_driver = AsyncGraphDatabase.driver(
+                settings.neo4j_uri, **_driver_config()
+            )
+        return self._async_driver
 
     def close(self):
-        if self.driver:
-            self.driver.close()
+        """
+        Release this connection
+
+        The sync driver is shared across connections and closed at process
+        exit, so there is nothing to tear down here.
+        """
+
+    async def close_async(self):
+        """Close the async driver (call from async shutdown code)"""
+        if self._async_driver:
+            await self._async_driver.close()
+            self._async_driver = None
+        self.close()
 
     def execute_query(
         self, query: str, parameters: Optional[Dict] = None
@@ -21,10 +100,88 @@ class Neo4jConnection:
             result = session.run(query, parameters or {})
             return [record.data() for record in result]
 
+    def explain(self, query: str, parameters: Optional[Dict] = None) -> None:
+        """
+        Plan a query with EXPLAIN without running it
+
+        Raises the driver's error if the query does not compile. The session
+        is pooled, read-mode and auto-commit, and no records are built.
+        """
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            session.run(f"EXPLAIN {query}", parameters or {}).consume()
+
+    async def warm_pool(self, connections: int) -> None:
+        """Open pool connections before the first requests need them"""
+        await self.async_driver.verify_connectivity()
+        await asyncio.gather(
+            *(self.execute_query_async("RETURN 1") for _ in range(connections))
+        )
+
+    async def execute_query_async(
+        self, query: str, parameters: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Execute a read-only Cypher query without blocking the event loop
+
+        Sessions are opened in read mode so a routing cluster can send them to
+        read replicas.
+        """
+        async with (
+            self._async_limit,
+            self.async_driver.session(default_access_mode=READ_ACCESS) as session,
+        ):
+            result = await session.run(query, parameters or {})
+            return [record.data() async for record in result]
+
+    async def execute_query_rows_async(
+        self, query: str, parameters: Optional[Dict] = None
+    ) -> List[Tuple]:
+        """
+        Execute a read-only Cypher query and return rows as tuples
+
+        Records are tuples in RETURN column order, so unlike
+        execute_query_async no dict is built per row. Nodes and relationships
+        are left as driver objects; use this for scalar and map columns.
+        """
+        async with (
+            self._async_limit,
+            self.async_driver.session(default_access_mode=READ_ACCESS) as session,
+        ):
+            result = await session.run(query, parameters or {})
+            return [record async for record in result]
+
+    async def stream_query_async(
+        self,
+        query: str,
+        parameters: Optional[Dict] = None,
+        batch_size: int = 1000,
+        rows: bool = False,
+    ) -> AsyncIterator[List]:
+        """
+        Yield read query results in batches instead of materializing them all
+
+        Batches hold dicts, or tuples in RETURN column order when rows is set.
+        Streams are paced by the client, so they take a permit from their own
+        limit rather than holding one of the regular async query permits.
+        """
+        async with (
+            self._stream_limit,
+            self.async_driver.session(default_access_mode=READ_ACCESS) as session,
+        ):
+            result = await session.run(query, parameters or {})
+            batch = []
+            async for record in result:
+                batch.append(record if rows else record.data())
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
     def execute_write(self, query: str, parameters: Optional[Dict] = None) -> Dict:
         """Execute a write transaction"""
         with self.driver.session() as session:
-            result = session.write_transaction(
+            result = session.execute_write(
                 lambda tx: tx.run(query, parameters or {}).consume()
             )
             return {
@@ -33,12 +190,41 @@ class Neo4jConnection:
                 "properties_set": result.counters.properties_set,
             }
 
+    def execute_many(self, queries: List[Union[str, Tuple[str, Dict]]]) -> None:
+        """
+        Run several statements in a single session and write transaction
+
+        Each item is a query string or a (query, parameters) tuple.
+        """
+        statements = [
+            (query, {}) if isinstance(query, str) else query for query in queries
+        ]
+        with self.driver.session() as session:
+            session.execute_write(
+                lambda tx: [
+                    tx.run(query, parameters).consume()
+                    for query, parameters in statements
+                ]
+            )
+
     def test_connection(self) -> bool:
-        """Test if Neo4j connection is working"""
+        """
+        Test if Neo4j connection is working
+
+        A success is trusted for CONNECTION_TEST_TTL seconds, so frequent
+        health probes do not each cost a round-trip.
+        """
+        if time.monotonic() - self._last_ok < CONNECTION_TEST_TTL:
+            return True
+
         try:
             with self.driver.session() as session:
                 result = session.run("RETURN 1 AS test")
-                return result.single()["test"] == 1
+                ok = result.single()["test"] == 1
         except Exception as e:
-            print(f"Neo4j connection test failed: {e}")
+            logger.error(f"Neo4j connection test failed: {e}")
             return False
+
+        if ok:
+            self._last_ok = time.monotonic()
+        return ok
@@ -1,24 +1,43 @@
+import asyncio
 import sys
 from loguru import logger
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.db.neo4j import Neo4jConnection
 from app.db.database import init_db
 from app.api import ingest, search, graph
+from app.services.entity_matcher import EntityMatcher
+from app.services.cypher_generator import CypherGenerator
+from app.services.query_cache import response_cache
 
 # --- Loguru Configuration ---
 logger.remove()
+# enqueue hands records to a background thread, so request handlers never
+# block on formatting or stderr writes
 logger.add(
     sys.stderr,
     level="INFO",
+    enqueue=True,
     format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
 )
 # --- End Loguru Configuration ---
 
 
+async def warm_up_neo4j(neo4j_conn: Neo4jConnection):
+    """Fill the connection pool, then warm the graph query plans"""
+    try:
+        await neo4j_conn.warm_pool(settings.neo4j_warm_connections)
+        logger.info("Neo4j connection pool warmed")
+    except Exception as e:
+        logger.error(f"Neo4j pool warmup failed: {e}")
+        return
+    await graph.warm_query_plans(neo4j_conn)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
@@ -36,14 +55,29 @@ async def lifespan(app: FastAPI):
     app.state.neo4j = neo4j_conn
     logger.info("Neo4j connection initialized")
 
+    # Initialize search services shared across requests
+    app.state.entity_matcher = EntityMatcher(neo4j_conn)
+    app.state.cypher_generator = CypherGenerator(neo4j_conn)
+
+    # Open pool connections and warm Neo4j's plan cache in the background
+    app.state.plan_warmup = asyncio.create_task(warm_up_neo4j(neo4j_conn))
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
-    neo4j_conn.close()
+    app.state.plan_warmup.cancel()
+    await neo4j_conn.close_async()
+    await response_cache.close()
+    await logger.complete()
 
 
-app = FastAPI(title=settings.app_name, version=settings.app_version, lifespan=lifespan)
+app = FastAPI(
+    title=settings.app_name,
+    version=settings.app_version,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # CORS middleware
 app.add_middleware(
@@ -15,6 +15,10 @@ class CypherResponse(BaseModel):
     """Response containing generated Cypher query"""
 
     cypher: str = Field(..., description="Generated Cypher query")
+    parameters: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Query parameters the Cypher refers to (mapped entity UUIDs)",
+    )
     entity_mappings: Dict[str, Dict[str, Any]] = Field(
         default_factory=dict,
         description="Mapping of extracted entities to database UUIDs",
@@ -39,6 +43,10 @@ class SearchResponse(BaseModel):
 
     results: List[Dict[str, Any]] = Field(..., description="Query results")
     cypher_used: str = Field(..., description="Cypher query that was executed")
+    parameters: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Query parameters the Cypher refers to (mapped entity UUIDs)",
+    )
     entity_mappings: Dict[str, EntityMatch] = Field(
         default_factory=dict, description="Entity mappings used in query"
     )
@@ -52,6 +60,10 @@ class GraphSearchResponse(BaseModel):
     nodes: List[Dict[str, Any]] = Field(..., description="Graph nodes")
     edges: List[Dict[str, Any]] = Field(..., description="Graph edges")
     cypher_used: str = Field(..., description="Cypher query that was executed")
+    parameters: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Query parameters the Cypher refers to (mapped entity UUIDs)",
+    )
     entity_mappings: Dict[str, EntityMatch] = Field(
         default_factory=dict, description="Entity mappings used in query"
     )
@@ -0,0 +1,17 @@
+"""Shared Anthropic client"""
+
+from functools import lru_cache
+from app.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_anthropic_client():
+    """
+    Anthropic client shared by every service, so all Claude calls reuse one
+    HTTP connection pool
+
+    Imported and created on first use to keep startup fast.
+    """
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=settings.anthropic_api_key)
@@ -1,6 +1,6 @@
 """Text chunking service"""
 
-from typing import List, Dict
+from typing import Dict, List
 from app.config import settings
 
 
@@ -11,50 +11,51 @@ class ChunkingService:
         self.chunk_size = settings.chunk_size
         self.chunk_overlap = settings.chunk_overlap
 
-    def chunk_text(self, text: str) -> List[Dict[str, any]]:
-        """
-        Split text into overlapping chunks
-
-        Args:
-            text: Full text to chunk
-
-        Returns:
-            List of chunk dictionaries with index and text
-        """
-        chunks = []
-        text_length = len(text)
-
+    def _chunk_starts(self, text_length: int) -> range:
+        """Start offsets of the chunks of a text_length-character text"""
         # Handle empty or very short text
         if text_length == 0:
-            return []
+            return range(0)
 
         if text_length <= self.chunk_size:
-            return [{"chunk_index": 0, "text": text}]
+            return range(1)
 
-        # Create overlapping chunks
-        start = 0
-        chunk_index = 0
+        # Consecutive chunks start step characters apart so they overlap by
+        # chunk_overlap; a chunk is only started while the previous one
+        # stopped short of the end of the text
+        step = self.chunk_size - self.chunk_overlap
+        return range(0, text_length - self.chunk_size + step, step)
 
-        while start < text_length:
-            # Calculate end position
-            end = min(start + self.chunk_size, text_length)
+    def chunk_texts(self, text: str) -> List[str]:
+        """
+        Split text into overlapping chunk strings
 
-            # Extract chunk
-            chunk_text = text[start:end]
+        A chunk's index is its position in the list, so no per-chunk dict is
+        built; use this when only the texts are needed.
 
-            # Add to chunks list
-            chunks.append({"chunk_index": chunk_index, "text": chunk_text})
+        Args:
+            text: Full text to chunk
+
+        Returns:
+            List of chunk texts in order
+        """
+        size = self.chunk_size
+        return [text[start : start + size] for start in self._chunk_starts(len(text))]
 
-            # Move to next chunk with overlap
-            # For the last chunk, we don't need overlap
-            if end < text_length:
-                start = end - self.chunk_overlap
-            else:
-                break
+    def chunk_text(self, text: str) -> List[Dict[str, any]]:
+        """
+        Split text into overlapping chunks
 
-            chunk_index += 1
+        Args:
+            text: Full text to chunk
 
-        return chunks
+        Returns:
+            List of chunk dictionaries with index and text
+        """
+        return [
+            {"chunk_index": chunk_index, "text": chunk}
+            for chunk_index, chunk in enumerate(self.chunk_texts(text))
+        ]
 
 
 # Singleton instance
@@ -1,11 +1,140 @@
 """Service for generating and validating Cypher queries from natural language"""
 
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
-import json
-from anthropic import Anthropic
+import orjson
+import re
+from loguru import logger
 from app.config import settings
 from app.db.neo4j import Neo4jConnection
 from app.models.search_schemas import EntityMatch
+from app.services.anthropic_client import get_anthropic_client
+
+# RETURN keywords and braces, scanned to find a query's top-level RETURN
+_RETURN_RE = re.compile(r"\bRETURN\b", re.IGNORECASE)
+_BRACE_RE = re.compile(r"[{}]")
+
+# Node variables in patterns like (var), (var:Label), or (var:Label {...})
+_NODE_VAR_RE = re.compile(r"\((\w+)(?::\w+)?(?:\s*\{[^}]*\})?\)")
+
+# Local checks run before EXPLAIN, so common LLM mistakes are caught without a
+# round-trip to Neo4j. String literals are masked first so values like
+# 'foot drop' do not look like write clauses, and keywords preceded by a dot,
+# backtick or $ are property keys, escaped names or parameters, not clauses.
+_STRING_LITERAL_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_FORBIDDEN_RE = re.compile(
+    r"(?<![.\w`$])\b(CREATE|MERGE|DELETE|SET|REMOVE|DROP)\b", re.IGNORECASE
+)
+_BAD_PROP_RE = re.compile(r"\w+\['[^']+'\]")
+
+
+# Static prompt parts, built once; only the query-specific pieces are
+# formatted in per call
+_CYPHER_PROMPT_HEADER = """Convert this natural language query to a Neo4j Cypher query.
+
+## Graph Schema:
+### Node Types:
+- Patient (uuid, name, dob, sex)
+- Encounter (uuid, date, dept, reason)
+- Clinician (uuid, name, specialty)
+- Disease (uuid, code, system, name)
+- Symptom (uuid, name, code, system)
+- Medication (uuid, code, system, name)
+- Procedure (uuid, code, system, name)
+- Test (uuid, name, loinc)
+- TestResult (uuid, value, unit, ref_low, ref_high, time)
+
+### Relationship Types:
+- HAS_ENCOUNTER: Patient -> Encounter
+- SEEN_BY: Encounter -> Clinician
+- HAS_SYMPTOM: Encounter -> Symptom
+- DIAGNOSED_AS: Encounter -> Disease
+- ORDERED_TEST: Encounter -> Test
+- HAS_RESULT: Encounter -> TestResult
+- OF_TEST: TestResult -> Test
+- PRESCRIBED: Encounter -> Medication
+- PERFORMED: Encounter -> Procedure
+
+"""
+
+_CYPHER_PROMPT_RULES = """
+
+## Important:
+1. ALWAYS match mapped entities by uuid through their parameter (e.g.
+   WHERE d.uuid = $e_0); never inline the UUID value
+2. Return only nodes and relationships that exist
+3. Use MATCH, not CREATE or MERGE
+4. Include relevant properties in RETURN
+5. Limit results appropriately (default 50)
+6. To collect several independent lists per node (e.g. symptoms and
+   diagnoses per encounter), use one CALL { WITH e OPTIONAL MATCH ... RETURN
+   collect(...) } subquery per list instead of chained OPTIONAL MATCHes,
+   which multiply rows
+
+"""
+
+_ENTITY_CONTEXT_HEADER = (
+    "\n## Mapped Entities (match on uuid using these query parameters):\n"
+)
+
+_FIX_PROMPT_HINTS = """
+
+Common fixes:
+- Variable naming issues: ensure variables are defined before use
+- Property access: use node.property not node['property']
+- Relationship syntax: use -[r:TYPE]-> not -[:TYPE]-
+- UUID matching: keep parameters such as WHERE n.uuid = $e_0 as they are
+- RETURN clause: ensure all used variables are returned or aggregated
+
+Return ONLY the fixed Cypher query:"""
+
+_ENTITY_PROMPT_TYPES = """
+
+Identify and categorize entities into these types:
+- patients (names of patients)
+- clinicians (names of doctors/nurses)
+- diseases (disease names or ICD codes)
+- symptoms (symptom descriptions)
+- medications (drug names)
+- procedures (procedure names)
+- tests (test names)
+
+Return as JSON with entity type as key and list of entity names as value.
+Example: {"patients": ["John Doe"], "diseases": ["diabetes"]}
+
+Return ONLY valid JSON:"""
+
+_JSON_ONLY_SYSTEM = "You must respond with a single JSON object and nothing else."
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a markdown code fence (```...```) around an LLM response"""
+    if not text.startswith("```"):
+        return text
+
+    # Drop the opening fence line, and the closing fence if the response has it
+    first = text.find("\n")
+    if first == -1:
+        return ""
+    body = text[first + 1 :]
+    if body.endswith("```"):
+        body = body[:-3].rstrip()
+    return body
+
+
+def entity_parameters(entity_mappings: Dict[str, EntityMatch]) -> Dict[str, str]:
+    """
+    Query parameters holding the UUIDs of mapped entities
+
+    Generated queries reference entity i as $e_i instead of inlining its
+    UUID, so Neo4j reuses one cached plan for every query of the same shape.
+    """
+    return {f"e_{i}": match.uuid for i, match in enumerate(entity_mappings.values())}
+
+
+def _entity_label(match: EntityMatch) -> str:
+    """First label of a matched entity, for the prompt's entity context"""
+    return match.matched_entity.get("__labels__", ["Unknown"])[0]
 
 
 class CypherGenerator:
@@ -13,7 +142,21 @@ class CypherGenerator:
 
     def __init__(self, neo4j: Neo4jConnection):
         self.neo4j = neo4j
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+
+    @property
+    def client(self):
+        """Shared Anthropic client"""
+        return get_anthropic_client()
+
+    def prepare(self, natural_query: str) -> Tuple[str, str]:
+        """
+        Normalize a natural language query once for the whole pipeline
+
+        Returns:
+            Tuple of (query text with whitespace collapsed, lowercase cache key)
+        """
+        text = " ".join(natural_query.split())
+        return text, text.lower()
 
     def natural_to_cypher(
         self,
@@ -40,8 +183,9 @@ class CypherGenerator:
         cypher = self._generate_cypher(natural_query, entity_mappings)
 
         # Validate and fix if necessary
+        parameters = entity_parameters(entity_mappings)
         for _ in range(max_retries):
-            is_valid, error = self._validate_cypher(cypher)
+            is_valid, error = self._validate_cypher(cypher, parameters)
             if is_valid:
                 return cypher, "valid"
 
@@ -50,6 +194,16 @@ class CypherGenerator:
 
         return cypher, f"potentially invalid after {max_retries} attempts"
 
+    def to_graph_cypher(self, cypher: str) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Rewrite a generated query to return every matched node with its labels
+
+        Returns:
+            Tuple of (graph_cypher, node_vars). When no node variables can be
+            found, the original query is returned with an empty tuple.
+        """
+        return _graph_form(cypher)
+
     def _generate_cypher(
         self, natural_query: str, entity_mappings: Dict[str, EntityMatch]
     ) -> str:
@@ -58,54 +212,16 @@ class CypherGenerator:
         # Build entity context
         entity_context = ""
         if entity_mappings:
-            entity_context = "\n## Mapped Entities (use these UUIDs in the query):\n"
-            for original, match in entity_mappings.items():
-                entity_type = (
-                    match.matched_entity.get("__labels__", ["Unknown"])[0]
-                    if "__labels__" in match.matched_entity
-                    else "Unknown"
-                )
-                entity_context += (
-                    f"- '{original}' -> {entity_type} with UUID: '{match.uuid}'\n"
-                )
-
-        prompt = f"""Convert this natural language query to a Neo4j Cypher query.
-
-## Graph Schema:
-### Node Types:
-- Patient (uuid, name, dob, sex)
-- Encounter (uuid, date, dept, reason)
-- Clinician (uuid, name, specialty)
-- Disease (uuid, code, system, name)
-- Symptom (uuid, name, code, system)
-- Medication (uuid, code, system, name)
-- Procedure (uuid, code, system, name)
-- Test (uuid, name, loinc)
-- TestResult (uuid, value, unit, ref_low, ref_high, time)
-
-### Relationship Types:
-- HAS_ENCOUNTER: Patient -> Encounter
-- SEEN_BY: Encounter -> Clinician
-- HAS_SYMPTOM: Encounter -> Symptom
-- DIAGNOSED_AS: Encounter -> Disease
-- ORDERED_TEST: Encounter -> Test
-- HAS_RESULT: Encounter -> TestResult
-- OF_TEST: TestResult -> Test
-- PRESCRIBED: Encounter -> Medication
-- PERFORMED: Encounter -> Procedure
-
-{entity_context}
-
-## Important:
-1. ALWAYS use UUID for matching when provided
-2. Return only nodes and relationships that exist
-3. Use MATCH, not CREATE or MERGE
-4. Include relevant properties in RETURN
-5. Limit results appropriately (default 50)
-
-Natural Language Query: {natural_query}
+            entity_context = _ENTITY_CONTEXT_HEADER + "".join(
+                f"- '{original}' -> {_entity_label(match)}: uuid = $e_{i}\n"
+                for i, (original, match) in enumerate(entity_mappings.items())
+            )
 
-Return ONLY the Cypher query, no explanation or markdown:"""
+        prompt = (
+            f"{_CYPHER_PROMPT_HEADER}{entity_context}{_CYPHER_PROMPT_RULES}"
+            f"Natural Language Query: {natural_query}"
+            "\n\nReturn ONLY the Cypher query, no explanation or markdown:"
+        )
 
         try:
             response = self.client.messages.create(
@@ -115,31 +231,34 @@ Return ONLY the Cypher query, no explanation or markdown:"""
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            cypher = response.content[0].text.strip()
-
             # Remove markdown code blocks if present
-            if cypher.startswith("```"):
-                lines = cypher.split("\n")
-                cypher = "\n".join(lines[1:-1])
-
-            return cypher
+            return _strip_code_fence(response.content[0].text.strip())
 
         except Exception as e:
-            print(f"Error generating Cypher: {e}")
+            logger.error(f"Error generating Cypher: {e}")
             # Return a safe default query
             return "MATCH (n) RETURN n LIMIT 10"
 
-    def _validate_cypher(self, cypher: str) -> Tuple[bool, Optional[str]]:
+    def _validate_cypher(
+        self, cypher: str, parameters: Optional[Dict] = None
+    ) -> Tuple[bool, Optional[str]]:
         """
         Validate Cypher query using EXPLAIN
 
+        Write clauses and node['prop'] access are rejected locally first,
+        skipping the EXPLAIN round-trip.
+
         Returns:
             Tuple of (is_valid, error_message)
         """
+        forbidden = _FORBIDDEN_RE.search(_STRING_LITERAL_RE.sub("''", cypher))
+        if forbidden:
+            return False, f"Forbidden operation: {forbidden.group().upper()}"
+        if _BAD_PROP_RE.search(cypher):
+            return False, "Use node.property instead of node['property']"
+
         try:
-            # Use EXPLAIN to validate without executing
-            explain_query = f"EXPLAIN {cypher}"
-            self.neo4j.execute_query(explain_query)
+            self.neo4j.explain(cypher, parameters)
             return True, None
         except Exception as e:
             return False, str(e)
@@ -147,24 +266,12 @@ Return ONLY the Cypher query, no explanation or markdown:"""
     def _fix_cypher_error(self, cypher: str, error: str, original_query: str) -> str:
         """Fix Cypher query error using Claude"""
 
-        prompt = f"""Fix this Cypher query error.
-
-Original natural language query: {original_query}
-
-Cypher query with error:
-{cypher}
-
-Error message:
-{error}
-
-Common fixes:
-- Variable naming issues: ensure variables are defined before use
-- Property access: use node.property not node['property']
-- Relationship syntax: use -[r:TYPE]-> not -[:TYPE]-
-- UUID matching: use WHERE n.uuid = 'value' not WHERE n.uuid = value
-- RETURN clause: ensure all used variables are returned or aggregated
-
-Return ONLY the fixed Cypher query:"""
+        prompt = (
+            "Fix this Cypher query error.\n\n"
+            f"Original natural language query: {original_query}\n\n"
+            f"Cypher query with error:\n{cypher}\n\n"
+            f"Error message:\n{error}{_FIX_PROMPT_HINTS}"
+        )
 
         try:
             response = self.client.messages.create(
@@ -174,59 +281,104 @@ Return ONLY the fixed Cypher query:"""
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            fixed_cypher = response.content[0].text.strip()
-
             # Remove markdown if present
-            if fixed_cypher.startswith("```"):
-                lines = fixed_cypher.split("\n")
-                fixed_cypher = "\n".join(lines[1:-1])
-
-            return fixed_cypher
+            return _strip_code_fence(response.content[0].text.strip())
 
         except Exception as e:
-            print(f"Error fixing Cypher: {e}")
+            logger.error(f"Error fixing Cypher: {e}")
             return cypher  # Return original if fix fails
 
     def extract_entities_from_query(self, natural_query: str) -> Dict[str, list]:
         """Extract entities from natural language query"""
 
-        prompt = f"""Extract medical entities from this query.
-
-Query: {natural_query}
-
-Identify and categorize entities into these types:
-- patients (names of patients)
-- clinicians (names of doctors/nurses)
-- diseases (disease names or ICD codes)
-- symptoms (symptom descriptions)
-- medications (drug names)
-- procedures (procedure names)
-- tests (test names)
-
-Return as JSON with entity type as key and list of entity names as value.
-Example: {{"patients": ["John Doe"], "diseases": ["diabetes"]}}
-
-Return ONLY valid JSON:"""
+        prompt = (
+            "Extract medical entities from this query.\n\n"
+            f"Query: {natural_query}{_ENTITY_PROMPT_TYPES}"
+        )
 
         try:
             response = self.client.messages.create(
                 model=settings.claude_model,
                 max_tokens=500,
                 temperature=0.3,
+                system=_JSON_ONLY_SYSTEM,
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            content = response.content[0].text.strip()
+            content = _strip_code_fence(response.content[0].text.strip())
+
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
 
-            # Extract JSON from response
-            if "{" in content and "}" in content:
-                json_start = content.find("{")
-                json_end = content.rfind("}") + 1
-                json_str = content[json_start:json_end]
-                return json.loads(json_str)
+            # Fall back to the outermost braces if the JSON has text around it
+            json_start = content.find("{")
+            json_end = content.rfind("}") + 1
+            if json_start != -1 and json_end > json_start:
+                return orjson.loads(content[json_start:json_end])
 
             return {}
 
         except Exception as e:
-            print(f"Error extracting entities: {e}")
+            logger.error(f"Error extracting entities: {e}")
             return {}
+
+
+def _top_level_view(cypher: str) -> str:
+    """
+    Copy of a query with string literal contents and everything inside braces
+    blanked out, keeping offsets
+
+    Braces themselves are kept, so property maps still read as (n:Label {}),
+    while RETURNs and patterns inside CALL { ... } subqueries disappear.
+    """
+    masked = _STRING_LITERAL_RE.sub(
+        lambda m: m.group()[0] + " " * (len(m.group()) - 2) + m.group()[0], cypher
+    )
+
+    pieces = []
+    depth = 0
+    pos = 0
+    for brace in _BRACE_RE.finditer(masked):
+        if brace.group() == "{":
+            if depth == 0:
+                pieces.append(masked[pos : brace.end()])
+                pos = brace.end()
+            depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                pieces.append(" " * (brace.start() - pos))
+                pos = brace.start()
+    pieces.append(masked[pos:] if depth == 0 else " " * (len(masked) - pos))
+    return "".join(pieces)
+
+
+@lru_cache(maxsize=512)
+def _graph_form(cypher: str) -> Tuple[str, Tuple[str, ...]]:
+    """Build (and memoize) the graph form of a Cypher query"""
+    # Split off the final RETURN clause, ignoring RETURNs inside subqueries
+    # and string literals
+    view = _top_level_view(cypher)
+    returns = list(_RETURN_RE.finditer(view))
+    split = returns[-1].start() if returns else len(cypher)
+    query_base = cypher[:split].strip()
+
+    # Extract the node variables of top-level MATCH patterns; subquery
+    # variables are not in scope for the new RETURN
+    node_vars = tuple(sorted(set(_NODE_VAR_RE.findall(view[:split]))))
+    if not node_vars:
+        return cypher, ()
+
+    # Create RETURN clause with nodes and their labels
+    return_clause = "RETURN " + ", ".join(
+        f"{var}, labels({var}) as {var}_labels" for var in node_vars
+    )
+
+    # Multi-node patterns can match the same node combination through several
+    # paths; collapse those rows on the server before they are sent back
+    if len(node_vars) > 1:
+        return_clause = f"WITH DISTINCT {', '.join(node_vars)}\n{return_clause}"
+
+    return f"{query_base}\n{return_clause}", node_vars
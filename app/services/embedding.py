@@ -1,7 +1,8 @@
 """Embedding service using VoyageAI"""
 
+from functools import cached_property
 from typing import List
-import voyageai
+from loguru import logger
 from app.config import settings
 
 
@@ -9,9 +10,15 @@ class EmbeddingService:
     """Service for generating text embeddings using VoyageAI"""
 
     def __init__(self):
-        self.client = voyageai.Client(api_key=settings.voyage_api_key)
         self.model = settings.voyage_model
 
+    @cached_property
+    def client(self):
+        """VoyageAI client, imported and created on first use to keep startup fast"""
+        import voyageai
+
+        return voyageai.Client(api_key=settings.voyage_api_key)
+
     def generate_embedding(self, text: str) -> List[float]:
         """
         Generate embedding for a single text
@@ -28,7 +35,7 @@ class EmbeddingService:
             )
             return result.embeddings[0]
         except Exception as e:
-            print(f"Embedding generation error: {e}")
+            logger.error(f"Embedding generation error: {e}")
             return None
 
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
@@ -47,7 +54,7 @@ class EmbeddingService:
             )
             return result.embeddings
         except Exception as e:
-            print(f"Batch embedding generation error: {e}")
+            logger.error(f"Batch embedding generation error: {e}")
             return [None] * len(texts)
 
 
@@ -1,9 +1,48 @@
 """Entity matching service using full-text search"""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import re
+from loguru import logger
 from app.db.neo4j import Neo4jConnection
 from app.models.search_schemas import EntityMatch
 
+# Map entity type to full-text index name
+INDEX_MAP = {
+    "patient": "patient_search",
+    "patients": "patient_search",
+    "clinician": "clinician_search",
+    "clinicians": "clinician_search",
+    "disease": "disease_search",
+    "diseases": "disease_search",
+    "symptom": "symptom_search",
+    "symptoms": "symptom_search",
+    "medication": "medication_search",
+    "medications": "medication_search",
+    "procedure": "procedure_search",
+    "procedures": "procedure_search",
+    "test": "test_search",
+    "tests": "test_search",
+}
+
+# Lucene query syntax characters and operator words; escaped in entity names
+# so one odd name cannot make the whole batched lookup fail to parse
+_LUCENE_SPECIAL_RE = re.compile(r'[+\-&|!(){}\[\]^"~*?:\\/]|\b(?:AND|OR|NOT)\b')
+
+# Best full-text hit per lookup, for a whole batch of lookups in one query
+BATCH_MATCH_QUERY = """
+UNWIND $lookups AS lookup
+CALL {
+    WITH lookup
+    CALL db.index.fulltext.queryNodes(lookup.index_name, lookup.query)
+    YIELD node, score
+    WHERE score > $min_score
+    RETURN node, score
+    ORDER BY score DESC
+    LIMIT 1
+}
+RETURN lookup.key as key, node, score
+"""
+
 
 class EntityMatcher:
     """Service for matching natural language entities to database entities"""
@@ -23,15 +62,13 @@ class EntityMatcher:
         Returns:
             Dict mapping original text to EntityMatch objects
         """
-        matches = {}
-
-        for entity_type, entity_names in extracted_entities.items():
-            for entity_name in entity_names:
-                match = self.find_entity_match(entity_type, entity_name)
-                if match:
-                    matches[entity_name] = match
+        lookups = [
+            (entity_type, entity_name)
+            for entity_type, entity_names in extracted_entities.items()
+            for entity_name in entity_names
+        ]
 
-        return matches
+        return self._match_batched(lookups)
 
     def find_entity_match(
         self, entity_type: str, query_text: str, min_score: float = 0.5
@@ -47,160 +84,8 @@ class EntityMatcher:
         Returns:
             EntityMatch object or None if no good match found
         """
-        # Map entity type to full-text index name
-        index_map = {
-            "patient": "patient_search",
-            "patients": "patient_search",
-            "clinician": "clinician_search",
-            "clinicians": "clinician_search",
-            "disease": "disease_search",
-            "diseases": "disease_search",
-            "symptom": "symptom_search",
-            "symptoms": "symptom_search",
-            "medication": "medication_search",
-            "medications": "medication_search",
-            "procedure": "procedure_search",
-            "procedures": "procedure_search",
-            "test": "test_search",
-            "tests": "test_search",
-        }
-
-        index_name = index_map.get(entity_type.lower())
-        if not index_name:
-            return None
-
-        # Try different matching strategies
-        # 1. Exact match
-        exact_match = self._exact_match(index_name, query_text)
-        if exact_match:
-            return exact_match
-
-        # 2. Fuzzy match (allows typos)
-        fuzzy_match = self._fuzzy_match(index_name, query_text, min_score)
-        if fuzzy_match:
-            return fuzzy_match
-
-        # 3. Partial match (wildcard)
-        partial_match = self._partial_match(index_name, query_text, min_score)
-        if partial_match:
-            return partial_match
-
-        return None
-
-    def _exact_match(self, index_name: str, query_text: str) -> Optional[EntityMatch]:
-        """Try exact match using full-text search"""
-        try:
-            query = f"""
-            CALL db.index.fulltext.queryNodes('{index_name}', $query)
-            YIELD node, score
-            WHERE score > 0.9
-            RETURN node, score
-            ORDER BY score DESC
-            LIMIT 1
-            """
-
-            results = self.neo4j.execute_query(query, {"query": f'"{query_text}"'})
-
-            if results:
-                node = results[0]["node"]
-                return EntityMatch(
-                    original_text=query_text,
-                    matched_entity=dict(node),
-                    uuid=node.get("uuid"),
-                    score=results[0]["score"],
-                    match_type="exact",
-                )
-        except Exception as e:
-            print(f"Exact match error: {e}")
-
-        return None
-
-    def _fuzzy_match(
-        self, index_name: str, query_text: str, min_score: float
-    ) -> Optional[EntityMatch]:
-        """Try fuzzy match allowing typos"""
-        try:
-            # Add fuzzy operator (~) to allow typos
-            # ~2 means allow up to 2 character edits
-            fuzzy_query = f"{query_text}~2"
-
-            query = f"""
-            CALL db.index.fulltext.queryNodes('{index_name}', $query)
-            YIELD node, score
-            WHERE score > $min_score
-            RETURN node, score
-            ORDER BY score DESC
-            LIMIT 1
-            """
-
-            results = self.neo4j.execute_query(
-                query, {"query": fuzzy_query, "min_score": min_score}
-            )
-
-            if results:
-                node = results[0]["node"]
-                return EntityMatch(
-                    original_text=query_text,
-                    matched_entity=dict(node),
-                    uuid=node.get("uuid"),
-                    score=results[0]["score"],
-                    match_type="fuzzy",
-                )
-        except Exception as e:
-            print(f"Fuzzy match error: {e}")
-
-        return None
-
-    def _partial_match(
-        self, index_name: str, query_text: str, min_score: float
-    ) -> Optional[EntityMatch]:
-        """Try partial match using wildcards"""
-        try:
-            # Try prefix match first
-            wildcard_query = f"{query_text}*"
-
-            query = f"""
-            CALL db.index.fulltext.queryNodes('{index_name}', $query)
-            YIELD node, score
-            WHERE score > $min_score
-            RETURN node, score
-            ORDER BY score DESC
-            LIMIT 1
-            """
-
-            results = self.neo4j.execute_query(
-                query, {"query": wildcard_query, "min_score": min_score}
-            )
-
-            if results:
-                node = results[0]["node"]
-                return EntityMatch(
-                    original_text=query_text,
-                    matched_entity=dict(node),
-                    uuid=node.get("uuid"),
-                    score=results[0]["score"],
-                    match_type="partial",
-                )
-
-            # Try contains match if prefix didn't work
-            wildcard_query = f"*{query_text}*"
-            results = self.neo4j.execute_query(
-                query, {"query": wildcard_query, "min_score": min_score * 0.8}
-            )
-
-            if results:
-                node = results[0]["node"]
-                return EntityMatch(
-                    original_text=query_text,
-                    matched_entity=dict(node),
-                    uuid=node.get("uuid"),
-                    score=results[0]["score"],
-                    match_type="partial",
-                )
-        except Exception as e:
-            print(f"Partial match error: {e}")
-
-        return None
+        matches = self._match_batched([(entity_type, query_text)], min_score)
+        return matches.get(query_text)
 
     def batch_match_entities(
         self, entity_list: List[str], entity_type: str
@@ -215,10 +100,141 @@ class EntityMatcher:
         Returns:
             Dict mapping original names to EntityMatch objects
         """
-        matches = {}
-        for entity_name in entity_list:
-            match = self.find_entity_match(entity_type, entity_name)
-            if match:
-                matches[entity_name] = match
+        lookups = [(entity_type, entity_name) for entity_name in entity_list]
 
-        return matches
+        return self._match_batched(lookups)
+
+    async def find_entity_match_async(
+        self, entity_type: str, query_text: str, min_score: float = 0.5
+    ) -> Optional[EntityMatch]:
+        """Async variant of find_entity_match, for use inside async endpoints"""
+        matches = await self._match_batched_async(
+            [(entity_type, query_text)], min_score
+        )
+        return matches.get(query_text)
+
+    def _match_batched(
+        self, lookups: List[Tuple[str, str]], min_score: float = 0.5
+    ) -> Dict[str, EntityMatch]:
+        """
+        Match (entity_type, entity_name) lookups with one query per strategy
+
+        Strategies run in order (exact, fuzzy, prefix, contains); each one only
+        queries the lookups that are still unmatched.
+        """
+        pending = _pending_lookups(lookups)
+        found = {}
+        for match_type, query_format, threshold in _strategies(min_score):
+            if not pending:
+                break
+
+            try:
+                results = self.neo4j.execute_query(
+                    BATCH_MATCH_QUERY,
+                    _batch_parameters(pending, query_format, threshold),
+                )
+            except Exception as e:
+                logger.error(f"{match_type.capitalize()} match error: {e}")
+                continue
+
+            _collect_matches(results, pending, found, match_type)
+
+        return _ordered_matches(lookups, found)
+
+    async def _match_batched_async(
+        self, lookups: List[Tuple[str, str]], min_score: float = 0.5
+    ) -> Dict[str, EntityMatch]:
+        """Same as _match_batched, using the async driver"""
+        pending = _pending_lookups(lookups)
+        found = {}
+        for match_type, query_format, threshold in _strategies(min_score):
+            if not pending:
+                break
+
+            try:
+                results = await self.neo4j.execute_query_async(
+                    BATCH_MATCH_QUERY,
+                    _batch_parameters(pending, query_format, threshold),
+                )
+            except Exception as e:
+                logger.error(f"{match_type.capitalize()} match error: {e}")
+                continue
+
+            _collect_matches(results, pending, found, match_type)
+
+        return _ordered_matches(lookups, found)
+
+
+def _pending_lookups(lookups: List[Tuple[str, str]]) -> Dict[int, Tuple[str, str]]:
+    """Map each lookup position to (index_name, entity_name), skipping unknown types"""
+    pending = {}
+    for key, (entity_type, entity_name) in enumerate(lookups):
+        index_name = INDEX_MAP.get(entity_type.lower())
+        if index_name:
+            pending[key] = (index_name, entity_name)
+    return pending
+
+
+def _strategies(min_score: float) -> Tuple[Tuple[str, str, float], ...]:
+    """(match_type, query format, score threshold) in the order they are tried"""
+    return (
+        ("exact", '"{}"', 0.9),
+        # ~2 means allow up to 2 character edits
+        ("fuzzy", "{}~2", min_score),
+        ("partial", "{}*", min_score),
+        ("partial", "*{}*", min_score * 0.8),
+    )
+
+
+def _batch_parameters(
+    pending: Dict[int, Tuple[str, str]], query_format: str, threshold: float
+) -> Dict:
+    """Parameters for BATCH_MATCH_QUERY covering every pending lookup"""
+    return {
+        "lookups": [
+            {
+                "key": key,
+                "index_name": index_name,
+                "query": query_format.format(
+                    _LUCENE_SPECIAL_RE.sub(r"\\\g<0>", entity_name)
+                ),
+            }
+            for key, (index_name, entity_name) in pending.items()
+        ],
+        "min_score": threshold,
+    }
+
+
+def _collect_matches(
+    results: List[Dict],
+    pending: Dict[int, Tuple[str, str]],
+    found: Dict[int, EntityMatch],
+    match_type: str,
+) -> None:
+    """
+    Move matched lookups from pending into found
+
+    Matches are built from our own full-text results, so validation is
+    skipped with model_construct.
+    """
+    for record in results:
+        _, entity_name = pending.pop(record["key"])
+        node = record["node"]
+        found[record["key"]] = EntityMatch.model_construct(
+            original_text=entity_name,
+            matched_entity=node,
+            uuid=node.get("uuid"),
+            score=record["score"],
+            match_type=match_type,
+        )
+
+
+def _ordered_matches(
+    lookups: List[Tuple[str, str]], found: Dict[int, EntityMatch]
+) -> Dict[str, EntityMatch]:
+    """Keep input order in the returned mapping"""
+    matches = {}
+    for key, (_, entity_name) in enumerate(lookups):
+        if key in found:
+            matches[entity_name] = found[key]
+    return matches
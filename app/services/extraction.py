@@ -2,17 +2,19 @@
 Entity extraction service using Claude
 """
 
-import traceback
 from typing import Dict, List, Optional
-import json
+import orjson
 from datetime import datetime
-from anthropic import Anthropic
+from loguru import logger
 from app.config import settings
+from app.services.anthropic_client import get_anthropic_client
 
 
 class ExtractionService:
-    def __init__(self):
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+    @property
+    def client(self):
+        """Shared Anthropic client"""
+        return get_anthropic_client()
 
     def extract_from_chunks(self, chunks: List[Dict]) -> Dict:
         """Extract entities and assertions from text chunks"""
@@ -42,7 +44,7 @@ class ExtractionService:
 
             # Try to find JSON in the response
             if not content:
-                print("ERROR: Empty response from Claude")
+                logger.error("Empty response from Claude")
                 return {"entities": {}, "assertions": []}
 
             # Look for JSON block in the response (handles markdown code blocks)
@@ -51,21 +53,20 @@ class ExtractionService:
 
             if json_start != -1 and json_end > json_start:
                 json_str = content[json_start:json_end]
-                result = json.loads(json_str)
+                result = orjson.loads(json_str)
                 return result
             else:
-                print("ERROR: No JSON found in response")
+                logger.error("No JSON found in response")
                 return {"entities": {}, "assertions": []}
 
-        except json.JSONDecodeError as e:
-            print(f"JSON parsing error: {e}")
-            print(
+        except orjson.JSONDecodeError as e:
+            logger.error(f"JSON parsing error: {e}")
+            logger.debug(
                 f"Content that failed to parse: {content[:1000] if 'content' in locals() else 'No content'}"
             )
             return {"entities": {}, "assertions": []}
         except Exception as e:
-            print(f"Extraction error: {e}")
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Extraction error: {e}")
             return {"entities": {}, "assertions": []}
 
     def _build_extraction_prompt(self, text: str, context: Dict = None) -> str:
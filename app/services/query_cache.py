@@ -0,0 +1,119 @@
+"""TTL caches for search translations, graph lookups and aggregate responses"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import threading
+import time
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+from loguru import logger
+from app.config import settings
+
+
+class QueryCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseCache:
+    """
+    Cache-aside store for slow-changing endpoint responses
+
+    Values are bytes, typically serialized response bodies, so hits are
+    served without re-encoding. They are kept in Redis when redis_url is
+    configured, so all workers share them; otherwise they fall back to an
+    in-process QueryCache. Redis errors are treated as cache misses.
+    """
+
+    def __init__(self, redis_url: str, ttl: int, prefix: str = "v1:graph:"):
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis_url = redis_url
+        self._redis: Optional[AsyncRedis] = (
+            AsyncRedis.from_url(redis_url) if redis_url else None
+        )
+        self._local = QueryCache(maxsize=128, ttl=float(ttl))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the cached bytes for key, or None on a miss"""
+        if self._redis is None:
+            return self._local.get(key)
+
+        try:
+            return await self._redis.get(self.prefix + key)
+        except RedisError as e:
+            logger.warning(f"Redis get error: {e}")
+            return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Store value under key for the configured TTL"""
+        if self._redis is None:
+            self._local.set(key, value)
+            return
+
+        try:
+            await self._redis.set(self.prefix + key, value, ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Redis set error: {e}")
+
+    def invalidate(self) -> None:
+        """Drop every cached response (called from sync ingest code)"""
+        self._local.clear()
+        if not self._redis_url:
+            return
+
+        try:
+            client = Redis.from_url(self._redis_url)
+            keys = list(client.scan_iter(match=self.prefix + "*"))
+            if keys:
+                client.delete(*keys)
+            client.close()
+        except RedisError as e:
+            logger.warning(f"Redis invalidate error: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection pool, if any"""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+# Singleton instances
+query_cache = QueryCache(maxsize=512, ttl=300.0)  # NL query -> generated Cypher
+relationship_cache = QueryCache(maxsize=256, ttl=60.0)  # node set -> relationships
+response_cache = ResponseCache(  # endpoint -> aggregate response
+    settings.redis_url, settings.cache_ttl_seconds
+)
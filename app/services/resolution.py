@@ -2,6 +2,31 @@ from typing import Dict, List, Any
 from app.db.neo4j import Neo4jConnection
 
 
+# Map entity type (singular or plural) to Neo4j node label
+LABEL_MAP = {
+    "patients": "Patient",
+    "patient": "Patient",
+    "encounters": "Encounter",
+    "encounter": "Encounter",
+    "symptoms": "Symptom",
+    "symptom": "Symptom",
+    "diseases": "Disease",
+    "disease": "Disease",
+    "tests": "Test",
+    "test": "Test",
+    "test_results": "TestResult",
+    "test_result": "TestResult",
+    "medications": "Medication",
+    "medication": "Medication",
+    "clinicians": "Clinician",
+    "clinician": "Clinician",
+    "procedures": "Procedure",
+    "procedure": "Procedure",
+    "guidelines": "Guideline",
+    "guideline": "Guideline",
+}
+
+
 class ResolutionService:
     def __init__(self, neo4j_conn: Neo4jConnection):
         self.neo4j = neo4j_conn
@@ -135,26 +160,4 @@ class ResolutionService:
 
     def _get_node_label(self, entity_type: str) -> str:
         """Map entity type to Neo4j node label"""
-        mapping = {
-            "patients": "Patient",
-            "patient": "Patient",
-            "encounters": "Encounter",
-            "encounter": "Encounter",
-            "symptoms": "Symptom",
-            "symptom": "Symptom",
-            "diseases": "Disease",
-            "disease": "Disease",
-            "tests": "Test",
-            "test": "Test",
-            "test_results": "TestResult",
-            "test_result": "TestResult",
-            "medications": "Medication",
-            "medication": "Medication",
-            "clinicians": "Clinician",
-            "clinician": "Clinician",
-            "procedures": "Procedure",
-            "procedure": "Procedure",
-            "guidelines": "Guideline",
-            "guideline": "Guideline",
-        }
-        return mapping.get(entity_type.lower(), "Unknown")
+        return LABEL_MAP.get(entity_type.lower(), "Unknown")